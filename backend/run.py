@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 import argparse
-import importlib.util
 import logging
 import os
 import subprocess
 import sys
 from typing import Optional
 
+import uvicorn
+
 
 def setup_basic_logging(log_level: str = "INFO") -> None:
     """Set up basic logging configuration for the script."""
@@ -34,15 +35,11 @@ def ensure_favicon_exists():
         # Check if we have the create_favicon script
         if os.path.exists("create_favicon.py"):
             try:
-                # Try to import and run the create_favicon module
-                spec = importlib.util.spec_from_file_location("create_favicon", "create_favicon.py")
-                if spec and spec.loader:
-                    create_favicon = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(create_favicon)
-                    create_favicon.create_favicon()
-                    logger.info("Favicon created successfully.")
-                else:
-                    logger.warning("Could not load create_favicon module.")
+                # Import and run the create_favicon module
+                from create_favicon import create_favicon
+
+                create_favicon()
+                logger.info("Favicon created successfully.")
             except Exception as e:
                 logger.error(f"Error creating favicon: {e}", exc_info=True)
                 logger.warning("Will use default favicon handling in FastAPI.")
@@ -60,6 +57,8 @@ def start_server(
     ngrok_domain: str = "fond-workable-firefly.ngrok-free.app",
     workers: Optional[int] = None,
     log_level: str = "INFO",
+    limit_concurrency: Optional[int] = None,
+    backlog: Optional[int] = None,
 ) -> None:
     """
     Start the FastAPI server in development or production mode with optional ngrok tunneling.
@@ -72,6 +71,8 @@ def start_server(
         ngrok_domain: The ngrok domain to use for tunneling
         workers: Number of worker processes (only used in production mode)
         log_level: Logging level
+        limit_concurrency: Maximum concurrent connections per worker before returning 503
+        backlog: Maximum number of pending connections
     """
     logger = logging.getLogger(__name__)
 
@@ -79,7 +80,7 @@ def start_server(
     sys.path.insert(0, os.path.abspath("."))
 
     # Validate configuration before starting the server
-    from src.core.config import create_directories, validate_config
+    from src.core.config import DIRECTORIES_READY_ENV, create_directories, validate_config
 
     print("\n" + "=" * 60)
     print("🚀 Starting EchoLingo Backend Server")
@@ -94,6 +95,8 @@ def start_server(
     # Create necessary directories
     try:
         create_directories()
+        # Tell the app's lifespan in each worker that it doesn't need to repeat this
+        os.environ[DIRECTORIES_READY_ENV] = "1"
         print("✅ Created necessary directories")
     except Exception as e:
         print(f"❌ Failed to create directories: {e}")
@@ -104,39 +107,48 @@ def start_server(
     # Ensure favicon exists
     ensure_favicon_exists()
 
-    # Determine the command to run based on the mode
+    # Determine the server configuration based on the mode
+    server_config = {
+        "host": host,
+        "port": port,
+        "log_level": log_level.lower(),
+        # uvloop and httptools are faster than the stdlib loop and h11; uvloop doesn't support Windows
+        "loop": "asyncio" if sys.platform == "win32" else "uvloop",
+        "http": "httptools",
+    }
     if mode == "dev":
         logger.info("Configuring server in development mode")
-        server_cmd = [
-            "uvicorn",
-            "src.app:app",
-            "--reload",
-            f"--host={host}",
-            f"--port={port}",
-            f"--log-level={log_level.lower()}",
-        ]
+        server_config["reload"] = True
     else:  # Production mode
         logger.info("Configuring server in production mode")
-        server_cmd = [
-            "uvicorn",
-            "src.app:app",
-            f"--host={host}",
-            f"--port={port}",
-            f"--log-level={log_level.lower()}",
-        ]
 
         # Add workers in production mode if specified
         if workers:
             logger.info(f"Using {workers} workers")
-            server_cmd.append(f"--workers={workers}")
         else:
             # Default to CPU count if not specified
             import multiprocessing
 
             cpu_count = multiprocessing.cpu_count()
-            workers = min(cpu_count * 2 + 1, 8)  # Common formula: (2 * CPU cores) + 1, capped at 8
+            # Common formula for I/O-bound services: (2 * CPU cores) + 1, optionally capped by MAX_WORKERS
+            workers = cpu_count * 2 + 1
+            max_workers = os.environ.get("MAX_WORKERS")
+            if max_workers:
+                try:
+                    worker_cap = int(max_workers)
+                except ValueError:
+                    worker_cap = 0
+                if worker_cap >= 1:
+                    workers = min(workers, worker_cap)
+                else:
+                    logger.warning(f"Ignoring invalid MAX_WORKERS value: {max_workers!r}")
             logger.info(f"Auto-configuring {workers} workers based on CPU count")
-            server_cmd.append(f"--workers={workers}")
+        server_config["workers"] = workers
+
+    if limit_concurrency:
+        server_config["limit_concurrency"] = limit_concurrency
+    if backlog:
+        server_config["backlog"] = backlog
 
     # Start ngrok in a separate process if requested
     ngrok_process = None
@@ -148,17 +160,18 @@ def start_server(
             f"--domain={ngrok_domain}",
             str(port),
         ]
+        # Nothing reads ngrok's output, so discard it rather than letting a full pipe stall ngrok
         ngrok_process = subprocess.Popen(
             ngrok_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         logger.info(f"Ngrok tunnel started at https://{ngrok_domain}")
 
     try:
         # Start the server
         logger.info(f"Starting server in {mode} mode on {host}:{port}")
-        subprocess.run(server_cmd)
+        uvicorn.run("src.app:app", **server_config)
     except KeyboardInterrupt:
         logger.info("\nShutting down server...")
     finally:
@@ -218,6 +231,16 @@ if __name__ == "__main__":
         default="INFO",
         help="Logging level (default: INFO)",
     )
+    parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        help="Maximum concurrent connections per worker before responding with 503",
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        help="Maximum number of pending connections (uvicorn default: 2048)",
+    )
 
     args = parser.parse_args()
 
@@ -232,4 +255,6 @@ if __name__ == "__main__":
         ngrok_domain=args.ngrok_domain,
         workers=args.workers,
         log_level=args.log_level,
+        limit_concurrency=args.limit_concurrency,
+        backlog=args.backlog,
     )
@@ -0,0 +1,65 @@
+"""
+ASGI middleware for the API.
+"""
+
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class JSONGZipMiddleware:
+    """
+    Gzip JSON responses above a size threshold.
+
+    Starlette's GZipMiddleware compresses every response type, which would re-compress the MP3s
+    served by FileResponse, drop their Content-Length and break Range requests. Only complete
+    application/json bodies are compressed here; everything else passes through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 6) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap
+            minimum_size: Smallest body, in bytes, worth compressing
+            compresslevel: Gzip compression level (1-9)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("accept-encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        # Held back until the body arrives, so the headers can still be rewritten
+        start_message: Message | None = None
+
+        async def send_with_compression(message: Message) -> None:
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if headers.get("content-type", "").startswith("application/json") and "content-encoding" not in headers:
+                    start_message = message
+                    return
+            elif message["type"] == "http.response.body" and start_message is not None:
+                initial_message, start_message = start_message, None
+                headers = MutableHeaders(raw=initial_message["headers"])
+                headers.add_vary_header("Accept-Encoding")
+
+                body = message.get("body", b"")
+                if not message.get("more_body", False) and len(body) >= self.minimum_size:
+                    body = gzip.compress(body, compresslevel=self.compresslevel, mtime=0)
+                    headers["Content-Encoding"] = "gzip"
+                    headers["Content-Length"] = str(len(body))
+                    message = {**message, "body": body}
+
+                await send(initial_message)
+
+            await send(message)
+
+        await self.app(scope, receive, send_with_compression)
@@ -2,6 +2,8 @@
 Pydantic models for audio processing.
 """
 
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -10,7 +12,9 @@ class AudioResponse(BaseModel):
 
     transcribed_text: str = Field(..., description="The transcribed text from the audio file")
     translated_text: str = Field(..., description="The translated text")
-    audio_url: str = Field(..., description="URL to access the generated audio file")
+    audio_url: Optional[str] = Field(
+        None, description="URL to access the generated audio file (absent if no audio was generated)"
+    )
 
 
 class AudioProcessRequest(BaseModel):
@@ -19,6 +23,18 @@ class AudioProcessRequest(BaseModel):
     target_language: str = Field(default="English", description="Target language for translation")
 
 
+class AudioStreamRequest(BaseModel):
+    """Request model for streaming speech generation."""
+
+    text: str = Field(..., min_length=1, description="Text to convert to speech")
+    voice_provider: Optional[str] = Field(
+        None, description="Voice provider to use for TTS (uses the configured provider if not specified)"
+    )
+    voice_id: Optional[str] = Field(
+        None, description="Voice ID to use for TTS (uses default if not specified)"
+    )
+
+
 class ErrorResponse(BaseModel):
     """Error response model."""
 
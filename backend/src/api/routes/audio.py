@@ -2,16 +2,18 @@
 API routes for audio processing.
 """
 
+import asyncio
 import os
+import stat
 import time
-import traceback
-from typing import Optional
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator, Optional
 
 from fastapi import APIRouter, File, HTTPException, Query, Request, UploadFile
-from fastapi.responses import FileResponse
-from pydub import AudioSegment
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 
-from src.api.models.audio import AudioResponse
+from src.api.models.audio import AudioResponse, AudioStreamRequest
 from src.core.config import get_settings
 from src.core.logging import get_logger
 from src.services import text_to_speech, transcription, translation
@@ -20,6 +22,8 @@ from src.utils import file_utils
 # Set up logger
 logger = get_logger(__name__)
 
+settings = get_settings()
+
 # Create router
 router = APIRouter(prefix="/api/audio", tags=["audio"])
 
@@ -34,10 +38,35 @@ def log_error(e: Exception, message: str, total_time: Optional[float] = None) ->
         total_time: Optional processing time before the error occurred
     """
     time_info = f" after {total_time:.2f}s" if total_time is not None else ""
-    error_message = f"{message}{time_info}: {str(e)}"
 
-    # Log with full traceback
-    logger.error(f"{error_message}\nTraceback: {traceback.format_exc()}")
+    # Log with full traceback; logging only formats it if a handler emits the record
+    logger.error("%s%s: %s", message, time_info, e, exc_info=e)
+
+
+@contextmanager
+def step(name: str) -> Iterator[None]:
+    """
+    Time a processing step and log its duration once it completes.
+
+    Args:
+        name: Name of the step, used in the log message
+    """
+    step_start_time = time.perf_counter()
+    yield
+    logger.info("%s completed in %.2fs", name, time.perf_counter() - step_start_time)
+
+
+def get_audio_executor(request: Request) -> Optional[Executor]:
+    """
+    Get the application's audio thread pool.
+
+    Args:
+        request: The FastAPI request object
+
+    Returns:
+        The executor, or None to use the loop's default when the lifespan hasn't run (e.g. in tests)
+    """
+    return getattr(request.app.state, "executor", None)
 
 
 @router.post("/process", response_model=AudioResponse)
@@ -69,17 +98,30 @@ async def process_audio(
     Returns:
         AudioResponse: Object containing transcribed text, translated text, and audio URL
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     logger.info(
-        f"Processing audio file: {file.filename}, target language: {target_language}, "
-        f"translate: {should_translate}, generate audio: {should_generate_audio}, "
-        f"voice provider: {voice_provider}, voice ID: {voice_id or 'default'}, "
-        f"guideline: {'provided' if guideline else 'none'}"
+        "Processing audio file: %s, target language: %s, translate: %s, generate audio: %s, "
+        "voice provider: %s, voice ID: %s, guideline: %s",
+        file.filename,
+        target_language,
+        should_translate,
+        should_generate_audio,
+        voice_provider,
+        voice_id or "default",
+        "provided" if guideline else "none",
     )
 
     # Log request content type and headers for debugging
-    content_type = request.headers.get("content-type", "")
-    logger.debug(f"Request content type: {content_type}")
+    logger.debug("Request content type: %s", request.headers.get("content-type", ""))
+
+    # Reject an implausible target language before doing any work, rather than silently falling
+    # back to the untranslated text
+    if should_translate:
+        try:
+            translation.validate_target_language(target_language)
+        except ValueError as e:
+            logger.warning("Rejected request: %s", e)
+            raise HTTPException(status_code=400, detail=str(e))
 
     try:
         # Validate file
@@ -88,15 +130,13 @@ async def process_audio(
             raise HTTPException(status_code=400, detail="No filename provided")
 
         # Log file details
-        logger.debug(f"File content type: {file.content_type}")
-        logger.debug(f"File size: {file.size if hasattr(file, 'size') else 'unknown'}")
+        logger.debug("File content type: %s", file.content_type)
+        logger.debug("File size: %s", file.size if hasattr(file, "size") else "unknown")
 
         # Save uploaded file
-        step_start_time = time.time()
         try:
-            temp_input_path = await file_utils.save_upload_file(file)
-            step_time = time.time() - step_start_time
-            logger.info(f"File upload saved in {step_time:.2f}s: {temp_input_path}")
+            with step("File upload save"):
+                temp_input_path = await file_utils.save_upload_file(file)
         except Exception as e:
             log_error(e, "Error saving uploaded file")
             raise HTTPException(status_code=400, detail=f"Error processing uploaded file: {str(e)}")
@@ -104,21 +144,18 @@ async def process_audio(
         # Get audio length
         audio_length_seconds = None
         try:
-            audio = AudioSegment.from_file(temp_input_path)
-            audio_length_seconds = len(audio) / 1000  # Convert milliseconds to seconds
-            logger.info(f"Audio length: {audio_length_seconds:.2f}s")
+            audio_length_seconds = await file_utils.get_audio_duration(temp_input_path)
+            logger.info("Audio length: %.2fs", audio_length_seconds)
         except Exception as e:
-            logger.warning(f"Could not determine audio length: {e}")
+            logger.warning("Could not determine audio length: %s", e)
 
         # Transcribe audio
         try:
-            step_start_time = time.time()
-            logger.info(f"Transcribing audio from {temp_input_path}")
-            transcribed_text = await transcription.transcribe_audio(temp_input_path)
-            step_time = time.time() - step_start_time
-            logger.info(f"Transcription completed in {step_time:.2f}s")
+            logger.info("Transcribing audio from %s", temp_input_path)
+            with step("Transcription"):
+                transcribed_text = await transcription.transcribe_audio(temp_input_path)
         except Exception as e:
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             log_error(e, "Error transcribing audio", total_time)
             raise HTTPException(status_code=500, detail=f"Error transcribing audio: {str(e)}")
 
@@ -128,15 +165,13 @@ async def process_audio(
         # Translate text if requested
         if should_translate:
             try:
-                step_start_time = time.time()
-                logger.info(f"Translating text to {target_language}")
-                translated_text = await translation.translate_text(
-                    transcribed_text, target_language, guideline
-                )
-                step_time = time.time() - step_start_time
-                logger.info(f"Translation completed in {step_time:.2f}s")
+                logger.info("Translating text to %s", target_language)
+                with step("Translation"):
+                    translated_text = await translation.translate_text_chunked(
+                        transcribed_text, target_language, guideline
+                    )
             except Exception as e:
-                total_time = time.time() - start_time
+                total_time = time.perf_counter() - start_time
                 log_error(e, f"Error translating text to {target_language}", total_time)
                 # Continue with original text if translation fails
                 logger.warning("Using original text due to translation failure")
@@ -148,49 +183,49 @@ async def process_audio(
         audio_url = None
         if should_generate_audio:
             try:
-                step_start_time = time.time()
                 output_audio_path = file_utils.generate_output_path("mp3")
-                logger.info(f"Generating speech to {output_audio_path}")
-                await text_to_speech.generate_speech(
-                    translated_text, output_audio_path, voice_provider, voice_id
-                )
-                step_time = time.time() - step_start_time
-                logger.info(f"Speech generation completed in {step_time:.2f}s")
+                logger.info("Generating speech to %s", output_audio_path)
+                with step("Speech generation"):
+                    await text_to_speech.generate_speech(
+                        translated_text, output_audio_path, voice_provider, voice_id
+                    )
 
                 # Get audio URL
                 audio_url = file_utils.get_file_url(output_audio_path)
             except Exception as e:
-                total_time = time.time() - start_time
+                total_time = time.perf_counter() - start_time
                 log_error(e, "Error generating speech", total_time)
                 # Continue without audio if generation fails
                 logger.warning("Continuing without audio due to speech generation failure")
         else:
             logger.info("Speech generation skipped as per request")
 
-        # Create response
-        step_start_time = time.time()
-        response = AudioResponse(
-            transcribed_text=transcribed_text,
-            translated_text=translated_text,
-            audio_url=audio_url,
-        )
-        step_time = time.time() - step_start_time
-        logger.info(f"Response preparation completed in {step_time:.2f}s")
+        # Create response; the payload is built here, so serialize it directly with orjson
+        # instead of re-validating it through AudioResponse (which only documents the schema)
+        with step("Response preparation"):
+            response = ORJSONResponse(
+                {
+                    "transcribed_text": transcribed_text,
+                    "translated_text": translated_text,
+                    "audio_url": audio_url,
+                }
+            )
 
         # Log total processing time
-        total_time = time.time() - start_time
-        logger.info(f"Total audio processing completed in {total_time:.2f}s")
+        total_time = time.perf_counter() - start_time
+        logger.info("Total audio processing completed in %.2fs", total_time)
 
         # Log processing efficiency if audio length is available
         if audio_length_seconds:
-            processing_ratio = total_time / audio_length_seconds
-            logger.info(f"Processing time ratio: {processing_ratio:.2f}x audio length")
+            logger.info(
+                "Processing time ratio: %.2fx audio length", total_time / audio_length_seconds
+            )
 
         return response
 
     except Exception as e:
         # Log error with time information and full traceback
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         log_error(e, "Error processing audio", total_time)
 
         # Provide more specific error messages based on exception type
@@ -204,27 +239,90 @@ async def process_audio(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/stream")
+async def stream_audio(body: AudioStreamRequest):
+    """
+    Generate speech from text and stream the audio to the client as it is synthesized.
+
+    Unlike /process, nothing is written to disk: the client starts receiving audio as soon as the
+    voice provider sends its first chunk.
+
+    Args:
+        body: Text to convert and the voice to use
+
+    Returns:
+        StreamingResponse: MP3 audio stream
+    """
+    logger.info(
+        "Streaming speech, text length: %d, voice provider: %s, voice ID: %s",
+        len(body.text),
+        body.voice_provider or "default",
+        body.voice_id or "default",
+    )
+
+    try:
+        audio_stream = text_to_speech.generate_speech_stream(
+            body.text, body.voice_provider, body.voice_id
+        )
+        # Wait for the first chunk, so failures before any audio still get an error status
+        first_chunk = await anext(audio_stream, b"")
+    except ValueError as e:
+        log_error(e, "Invalid speech stream request")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        log_error(e, "Error starting speech stream")
+        raise HTTPException(status_code=500, detail=f"Error generating speech: {str(e)}")
+
+    async def relay() -> AsyncIterator[bytes]:
+        yield first_chunk
+        async for chunk in audio_stream:
+            yield chunk
+
+    return StreamingResponse(
+        relay(),
+        media_type="audio/mpeg",
+        # Tell proxies such as nginx to pass chunks through instead of buffering the response
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{filename}")
-async def get_audio(filename: str):
+async def get_audio(request: Request, filename: str):
     """
     Get an audio file by filename.
 
+    The file is stat'ed once off the event loop and the result handed to FileResponse, which
+    sets Content-Length/ETag, answers Range requests and uses sendfile where the server supports it.
+
     Args:
+        request: The FastAPI request object
         filename: Name of the audio file
 
     Returns:
         FileResponse: Audio file
     """
-    logger.debug(f"Request for audio file: {filename}")
-    settings = get_settings()
+    logger.debug("Request for audio file: %s", filename)
 
     # Construct the full path
-    audio_path = settings.TEMP_DIR / "output" / filename
+    audio_path = settings.OUTPUT_DIR / filename
 
-    # Check if file exists
-    if not os.path.exists(audio_path):
-        logger.warning(f"Audio file not found: {audio_path}")
+    # Stat the file, which also checks that it exists
+    try:
+        stat_result = await asyncio.get_running_loop().run_in_executor(
+            get_audio_executor(request), os.stat, audio_path
+        )
+    except FileNotFoundError:
+        stat_result = None
+
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+        logger.warning("Audio file not found: %s", audio_path)
         raise HTTPException(status_code=404, detail="Audio file not found")
 
-    logger.debug(f"Serving audio file: {audio_path}")
-    return FileResponse(audio_path)
+    logger.debug("Serving audio file: %s", audio_path)
+    return FileResponse(
+        audio_path,
+        stat_result=stat_result,
+        media_type="audio/mpeg",
+        filename=filename,
+        content_disposition_type="inline",
+    )
@@ -3,8 +3,10 @@ Root API routes.
 """
 
 import os
+from pathlib import Path
+from typing import Optional
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Response
 from fastapi.responses import FileResponse, JSONResponse
 
 from src.core.config import get_settings
@@ -13,34 +15,55 @@ from src.core.logging import get_logger
 # Set up logger
 logger = get_logger(__name__)
 
+# Settings are immutable after startup, so resolve them once for the hot routes
+settings = get_settings()
+
 # Create router
 router = APIRouter()
 
 
-@router.get("/", tags=["root"])
-async def root(request: Request):
+def _stat_favicon(path: Path) -> Optional[os.stat_result]:
     """
-    Root endpoint that returns basic application information.
+    Stat the favicon file.
 
     Args:
-        request: FastAPI request object
+        path: Path to the favicon
 
     Returns:
-        JSONResponse: Basic application information
+        The stat result, or None if the favicon doesn't exist
     """
-    logger.debug("Root endpoint accessed")
-    settings = get_settings()
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+# The favicon is created before the app starts (see run.py), so check for it once at import
+favicon_path = settings.STATIC_DIR / "favicon.ico"
+favicon_stat = _stat_favicon(favicon_path)
+
+
+# Application info is static, so build the root payload once; the docs links are relative to the
+# app root rather than rebuilt from the request URL on every hit
+APP_INFO = {
+    "app_name": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+    "description": settings.APP_DESCRIPTION,
+    "docs_url": "/docs",
+    "redoc_url": "/redoc",
+}
 
-    response_data = {
-        "app_name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "description": settings.APP_DESCRIPTION,
-        "docs_url": f"{request.url._url}docs",
-        "redoc_url": f"{request.url._url}redoc",
-    }
 
-    logger.debug(f"Returning application info: {response_data}")
-    return JSONResponse(response_data)
+@router.get("/", tags=["root"])
+async def root():
+    """
+    Root endpoint that returns basic application information.
+
+    Returns:
+        JSONResponse: Basic application information
+    """
+    logger.debug("Root endpoint accessed")
+    return JSONResponse(APP_INFO)
 
 
 @router.get("/health", tags=["health"])
@@ -64,14 +87,10 @@ async def get_favicon():
         FileResponse: Favicon file or 204 No Content
     """
     logger.debug("Favicon requested")
-    settings = get_settings()
 
-    # Check if favicon exists in static directory
-    favicon_path = settings.STATIC_DIR / "favicon.ico"
-    if not os.path.exists(favicon_path):
+    if favicon_stat is None:
         logger.debug("Favicon not found, returning 204 No Content")
         # Return 204 No Content if favicon doesn't exist
-        return FileResponse(status_code=204)
+        return Response(status_code=204)
 
-    logger.debug(f"Serving favicon from {favicon_path}")
-    return FileResponse(favicon_path)
+    return FileResponse(favicon_path, stat_result=favicon_stat, media_type="image/x-icon")
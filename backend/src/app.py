@@ -2,15 +2,23 @@
 Main FastAPI application.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from src.api.middleware import JSONGZipMiddleware
 from src.api.routes import router
-from src.core.config import create_directories, get_settings
+from src.core.config import DIRECTORIES_READY_ENV, create_directories, get_settings
 from src.core.logging import get_logger, setup_logging
+from src.services.clients import close_clients
+from src.services.providers.factory import reset_translation_providers
+from src.services.voice_providers.factory import reset_voice_providers
 
 # Set up logging
 setup_logging()
@@ -25,14 +33,31 @@ async def lifespan(app: FastAPI):
     Args:
         app: FastAPI application
     """
-    # Setup: Create necessary directories
-    logger.info("Creating necessary directories")
-    create_directories()
+    settings = get_settings()
+
+    # Setup: Create necessary directories, unless run.py already did before starting the workers
+    if not os.environ.get(DIRECTORIES_READY_ENV):
+        logger.info("Creating necessary directories")
+        create_directories()
+
+    # Setup: Thread pool for blocking file operations, sized independently of uvicorn workers
+    logger.info(f"Starting audio executor with {settings.AUDIO_EXECUTOR_WORKERS} threads")
+    app.state.executor = ThreadPoolExecutor(
+        max_workers=settings.AUDIO_EXECUTOR_WORKERS, thread_name_prefix="audio"
+    )
+    # Also make it the loop's default, so asyncio.to_thread and aiofiles file IO run on it too
+    asyncio.get_running_loop().set_default_executor(app.state.executor)
     logger.info("Application startup complete")
 
     yield
 
-    # Cleanup: Nothing to do here for now
+    # Cleanup: Shut down the audio executor
+    app.state.executor.shutdown(wait=True)
+
+    # Cleanup: Close the shared API connections; providers holding those clients are dropped too
+    reset_translation_providers()
+    reset_voice_providers()
+    await close_clients()
     logger.info("Application shutdown")
 
 
@@ -52,8 +77,13 @@ def create_application() -> FastAPI:
         description=settings.APP_DESCRIPTION,
         version=settings.APP_VERSION,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
+    # Compress large JSON responses (transcripts and translations can run to many KB)
+    logger.debug("Configuring JSON gzip middleware")
+    app.add_middleware(JSONGZipMiddleware, minimum_size=1024)
+
     # Add CORS middleware
     logger.debug("Configuring CORS middleware")
     app.add_middleware(
@@ -64,9 +94,10 @@ def create_application() -> FastAPI:
         allow_headers=settings.CORS_ALLOW_HEADERS,
     )
 
-    # Mount static files directory
-    logger.debug(f"Mounting static files directory: {settings.STATIC_DIR}")
-    app.mount("/static", StaticFiles(directory=str(settings.STATIC_DIR)), name="static")
+    # Mount static files directory; it is created at startup, so skip StaticFiles' directory check
+    static_dir = str(settings.STATIC_DIR)
+    logger.debug(f"Mounting static files directory: {static_dir}")
+    app.mount("/static", StaticFiles(directory=static_dir, check_dir=False), name="static")
 
     # Include API routes
     logger.debug("Including API routes")
@@ -2,8 +2,7 @@
 Configuration settings for the EchoLingo application.
 """
 
-import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic import Field, ValidationError, field_validator
@@ -34,6 +33,11 @@ class Settings(BaseSettings):
     STATIC_DIR: Path = Field(default_factory=lambda: Path("static"))
     LOGS_DIR: Path = Field(default_factory=lambda: Path("logs"))
 
+    # Concurrency settings
+    AUDIO_EXECUTOR_WORKERS: int = Field(
+        default=8, description="Threads available per worker process for blocking audio file operations"
+    )
+
     # Logging settings
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -77,48 +81,33 @@ class Settings(BaseSettings):
     # Default voice and model settings
     DEFAULT_VOICE_ID: str = "9mW7DR7UTehA5cbI4AYo"
     DEFAULT_TTS_MODEL: str = "eleven_v3"
+    DEFAULT_STREAMING_TTS_MODEL: str = Field(
+        default="eleven_flash_v2_5",
+        description="ElevenLabs model for streamed text input (the WebSocket API doesn't support v3)",
+    )
     DEFAULT_TRANSLATION_MODEL: str = "gpt-4o-mini"
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="ignore"
     )
 
+    @cached_property
+    def INPUT_DIR(self) -> Path:
+        """Directory for uploaded audio files."""
+        return self.TEMP_DIR / "input"
+
+    @cached_property
+    def OUTPUT_DIR(self) -> Path:
+        """Directory for generated audio files."""
+        return self.TEMP_DIR / "output"
+
     @field_validator("OPENAI_API_KEY")
     @classmethod
     def validate_openai_key(cls, v: str) -> str:
         """Validate OpenAI API key."""
+        # Only check presence; the key format is left to OpenAI, whose key prefixes change over time
         if not v or v == "your_openai_api_key_here":
             raise ValueError("OPENAI_API_KEY is required. Please set it in your .env file.")
-        if not v.startswith("sk-"):
-            raise ValueError("Invalid OPENAI_API_KEY format. It should start with 'sk-'")
-        return v
-
-    @field_validator("ELEVENLABS_API_KEY")
-    @classmethod
-    def validate_elevenlabs_key(cls, v: str, info) -> str:
-        """Validate ElevenLabs API key when using elevenlabs provider."""
-        voice_provider = info.data.get("VOICE_PROVIDER", "hume")
-
-        if voice_provider == "elevenlabs":
-            if not v or v == "your_elevenlabs_api_key_here":
-                raise ValueError(
-                    "ELEVENLABS_API_KEY is required when using elevenlabs provider. "
-                    "Please set it in your .env file."
-                )
-        return v
-
-    @field_validator("HUME_API_KEY")
-    @classmethod
-    def validate_hume_key(cls, v: str, info) -> str:
-        """Validate Hume API key when using hume provider."""
-        voice_provider = info.data.get("VOICE_PROVIDER", "hume")
-
-        if voice_provider == "hume":
-            if not v or v == "your_hume_api_key_here":
-                raise ValueError(
-                    "HUME_API_KEY is required when using hume provider. "
-                    "Please set it in your .env file."
-                )
         return v
 
     @field_validator("VOICE_PROVIDER")
@@ -148,33 +137,50 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid TRANSLATION_PROVIDER: {v}. Must be one of {valid_providers}")
         return v.lower()
 
-    @field_validator("SAMBANOVA_API_KEY")
-    @classmethod
-    def validate_sambanova_key(cls, v: str, info) -> str:
-        """Validate SambaNova API key when using sambanova provider."""
-        # Get the translation provider from the data being validated
-        translation_provider = info.data.get("TRANSLATION_PROVIDER", "openai")
-
-        if translation_provider == "sambanova":
-            if not v or v == "your_sambanova_api_key_here":
-                raise ValueError(
-                    "SAMBANOVA_API_KEY is required when using sambanova provider. "
-                    "Please set it in your .env file."
-                )
-        return v
+    def require_api_key(self, field: str, provider: str) -> str:
+        """
+        Get a provider API key, checking it once when the provider is created.
+
+        Args:
+            field: Name of the API key setting, e.g. "HUME_API_KEY"
+            provider: Name of the provider that needs the key
+
+        Returns:
+            The API key
+
+        Raises:
+            ValueError: If the key is missing or still the .env.example placeholder
+        """
+        value = getattr(self, field)
+        if not value or value == f"your_{field.lower()}_here":
+            raise ValueError(
+                f"{field} is required when using {provider} provider. "
+                "Please set it in your .env file."
+            )
+        return value
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get application settings from environment variables or .env file.
 
+    The settings are loaded once and the same instance is returned on every later call.
+
     Returns:
         Settings: Application settings
     """
     return Settings()
 
 
+# API key setting required by each provider (OpenAI's key is always required, see Settings)
+PROVIDER_API_KEYS = {
+    "hume": "HUME_API_KEY",
+    "elevenlabs": "ELEVENLABS_API_KEY",
+    "sambanova": "SAMBANOVA_API_KEY",
+}
+
+
 def validate_config() -> tuple[bool, str]:
     """
     Validate configuration on startup.
@@ -182,21 +188,25 @@ def validate_config() -> tuple[bool, str]:
     Returns:
         tuple: (is_valid, error_message)
     """
+    # Check if .env file exists before building the settings from it
+    env_file = Path(".env")
+    if not env_file.exists():
+        return False, (
+            "⚠️  .env file not found!\n"
+            "Please create a .env file with your configuration.\n"
+            "You can copy .env.example as a template:\n"
+            "  cp .env.example .env"
+        )
+
     try:
+        # Settings validation will happen automatically through Pydantic
         settings = get_settings()
 
-        # Check if .env file exists
-        env_file = Path(".env")
-        if not env_file.exists():
-            return False, (
-                "⚠️  .env file not found!\n"
-                "Please create a .env file with your configuration.\n"
-                "You can copy .env.example as a template:\n"
-                "  cp .env.example .env"
-            )
+        # Provider API keys aren't Settings validators, so check the configured providers' keys here
+        for provider in (settings.VOICE_PROVIDER, settings.TRANSLATION_PROVIDER):
+            if provider in PROVIDER_API_KEYS:
+                settings.require_api_key(PROVIDER_API_KEYS[provider], provider)
 
-        # Settings validation will happen automatically through Pydantic
-        # If we get here, all validations passed
         print("✅ Configuration loaded and validated successfully!")
         print(f"   - OpenAI API Key: {'*' * 8}{settings.OPENAI_API_KEY[-4:]}")
 
@@ -230,21 +240,30 @@ def validate_config() -> tuple[bool, str]:
             + "\n".join(error_messages)
             + "\n\nPlease check your .env file and ensure all required fields are set correctly."
         )
+    except ValueError as e:
+        return False, (
+            "❌ Configuration validation failed!\n"
+            f"   - {e}\n\n"
+            "Please check your .env file and ensure all required fields are set correctly."
+        )
     except Exception as e:
         return False, f"❌ Unexpected error loading configuration: {str(e)}"
 
 
+# Set by run.py once it has created the directories, so app workers can skip it
+DIRECTORIES_READY_ENV = "ECHOLINGO_DIRECTORIES_READY"
+
+
 # Create necessary directories
 def create_directories():
     """Create necessary directories for the application."""
     settings = get_settings()
 
-    # Create temp directories
-    os.makedirs(settings.TEMP_DIR / "input", exist_ok=True)
-    os.makedirs(settings.TEMP_DIR / "output", exist_ok=True)
-
-    # Create static directory
-    os.makedirs(settings.STATIC_DIR, exist_ok=True)
-
-    # Create logs directory
-    os.makedirs(settings.LOGS_DIR, exist_ok=True)
+    # Create temp, static and logs directories
+    for directory in (
+        settings.INPUT_DIR,
+        settings.OUTPUT_DIR,
+        settings.STATIC_DIR,
+        settings.LOGS_DIR,
+    ):
+        directory.mkdir(parents=True, exist_ok=True)
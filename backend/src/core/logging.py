@@ -2,26 +2,69 @@
 Logging configuration for the application.
 """
 
+import atexit
+import copy
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 from src.core.config import get_settings
 
+# Format for error.log, which adds the source location of each record
+DETAILED_LOG_FORMAT = (
+    "%(asctime)s - %(name)s - %(levelname)s - %(pathname)s:%(lineno)d - %(message)s"
+)
+
+# Background listener that writes queued log records to the real handlers
+_queue_listener: Optional[QueueListener] = None
+
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener's handlers.
+
+    The stock QueueHandler formats each record in the logging thread so that it can be pickled,
+    which the in-process queue used here doesn't need.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for the queue, merging its arguments into the message.
+
+        The arguments are merged now because they may change before the listener gets to the
+        record; timestamps and tracebacks are formatted on the listener thread.
+
+        Args:
+            record: Log record to enqueue
+
+        Returns:
+            A copy of the record with its message merged
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 
 def setup_logging(log_level: Optional[str] = None) -> None:
     """
     Configure logging for the application.
 
+    The root logger only merges each record's message and enqueues it; a background QueueListener
+    thread formats the records and writes them to the console and log files, so request handlers
+    never block on formatting tracebacks or on log I/O.
+
     Args:
         log_level: Optional override for the log level
     """
+    global _queue_listener
     settings = get_settings()
 
     # Determine log level from settings or parameter
     level_name = log_level or settings.LOG_LEVEL
-    level = getattr(logging, level_name.upper(), logging.INFO)
+    level = logging.getLevelNamesMapping().get(level_name.upper(), logging.INFO)
 
     # Create logs directory if it doesn't exist
     log_dir = settings.LOGS_DIR
@@ -32,14 +75,12 @@ def setup_logging(log_level: Optional[str] = None) -> None:
     root_logger.setLevel(level)
 
     # Clear any existing handlers to avoid duplication
-    if root_logger.handlers:
-        root_logger.handlers.clear()
+    root_logger.handlers.clear()
 
-    # Create formatters
-    formatter = logging.Formatter(settings.LOG_FORMAT)
-    detailed_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(pathname)s:%(lineno)d - %(message)s"
-    )
+    # Create formatters; the console and app.log handlers share one, and both use %-style
+    # formats, so skip the format-string validation pass
+    formatter = logging.Formatter(settings.LOG_FORMAT, validate=False)
+    detailed_formatter = logging.Formatter(DETAILED_LOG_FORMAT, validate=False)
 
     # Create handlers
     console_handler = logging.StreamHandler(sys.stdout)
@@ -64,10 +105,16 @@ def setup_logging(log_level: Optional[str] = None) -> None:
     error_file_handler.setFormatter(detailed_formatter)
     error_file_handler.setLevel(logging.ERROR)
 
-    # Add handlers to root logger
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(error_file_handler)
+    # Stop the listener from any previous setup before replacing its handlers
+    stop_logging()
+
+    # Route root logger records through a queue to the handlers on a background thread
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(_DeferredFormatQueueHandler(log_queue))
+    _queue_listener = QueueListener(
+        log_queue, console_handler, file_handler, error_file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
 
     # Set log levels for third-party libraries
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -80,6 +127,18 @@ def setup_logging(log_level: Optional[str] = None) -> None:
     logger.info(f"Log files will be stored in: {log_dir.absolute()}")
 
 
+def stop_logging() -> None:
+    """Stop the background log listener, flushing any queued records to the handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+# Flush queued records when the process exits
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the specified name.
@@ -0,0 +1,73 @@
+"""
+Shared API clients for the external services.
+"""
+
+from functools import lru_cache
+
+import httpx
+import openai
+
+from src.core.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used by the OpenAI-compatible and TTS API clients.
+
+    HTTP/2 lets concurrent requests to the same API multiplex over one kept-alive TLS connection,
+    instead of each paying for its own TCP and TLS handshake. Idle connections are kept for 60s
+    rather than httpx's default of 5s, so requests after a short lull still find a warm connection.
+
+    Returns:
+        httpx.AsyncClient: HTTP client with the OpenAI SDK's default timeouts
+    """
+    return openai.DefaultAsyncHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> openai.AsyncOpenAI:
+    """
+    Get the shared OpenAI client, used for both transcription and translation.
+
+    The client is async and created once, so calls don't block the event loop and its connection
+    pool is reused across calls.
+
+    Returns:
+        openai.AsyncOpenAI: OpenAI client
+    """
+    return openai.AsyncOpenAI(api_key=get_settings().OPENAI_API_KEY, http_client=get_http_client())
+
+
+@lru_cache(maxsize=1)
+def get_sambanova_client() -> openai.AsyncOpenAI:
+    """
+    Get the shared client for SambaNova's OpenAI-compatible API.
+
+    Returns:
+        openai.AsyncOpenAI: OpenAI client pointed at SambaNova
+    """
+    settings = get_settings()
+    return openai.AsyncOpenAI(
+        api_key=settings.SAMBANOVA_API_KEY,
+        base_url=settings.SAMBANOVA_BASE_URL,
+        http_client=get_http_client(),
+    )
+
+
+async def close_clients() -> None:
+    """
+    Close the shared HTTP client and forget the API clients built on it.
+
+    Called at application shutdown, after dropping the cached providers that hold SDK clients built
+    on it; the clients are recreated on next use.
+    """
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+
+    get_http_client.cache_clear()
+    get_openai_client.cache_clear()
+    get_sambanova_client.cache_clear()
@@ -9,6 +9,9 @@ from .sambanova_provider import SambaNovaTranslationProvider
 
 logger = get_logger(__name__)
 
+# Provider instances by name; each holds an API client whose connection pool should be reused
+_PROVIDER_CACHE: dict[str, BaseTranslationProvider] = {}
+
 
 class TranslationProviderFactory:
     """Factory for creating translation providers based on configuration."""
@@ -27,7 +30,7 @@ class TranslationProviderFactory:
         settings = get_settings()
         provider_name = settings.TRANSLATION_PROVIDER
 
-        logger.info(f"Creating translation provider: {provider_name}")
+        logger.info("Creating translation provider: %s", provider_name)
 
         if provider_name == "openai":
             return OpenAITranslationProvider()
@@ -44,7 +47,19 @@ def get_translation_provider() -> BaseTranslationProvider:
     """
     Get the configured translation provider instance.
 
+    The provider is created on first use and cached, so its API client and connection pool are
+    shared across requests.
+
     Returns:
         BaseTranslationProvider: The translation provider instance
     """
-    return TranslationProviderFactory.create_provider()
+    provider_name = get_settings().TRANSLATION_PROVIDER
+    provider = _PROVIDER_CACHE.get(provider_name)
+    if provider is None:
+        provider = _PROVIDER_CACHE.setdefault(provider_name, TranslationProviderFactory.create_provider())
+    return provider
+
+
+def reset_translation_providers() -> None:
+    """Forget the cached translation providers, e.g. after their API clients have been closed."""
+    _PROVIDER_CACHE.clear()
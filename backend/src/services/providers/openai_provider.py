@@ -1,22 +1,41 @@
 """OpenAI translation provider implementation."""
 
-import openai
+from functools import lru_cache
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
+from src.services.clients import get_openai_client
 
 from .base import BaseTranslationProvider
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _build_system_prompt(target_language: str, guideline: str) -> str:
+    """
+    Build the translation system prompt, cached per target language and guideline.
+
+    Args:
+        target_language: Target language for translation
+        guideline: Additional translation guidelines (may be empty)
+
+    Returns:
+        System prompt text
+    """
+    guideline_text = f" {guideline}" if guideline else ""
+    return f"""You are a translation assistant.
+        Translate the following text into {target_language}. {guideline_text}
+        Provide only the translated text without any explanations or additional content."""
+
+
 class OpenAITranslationProvider(BaseTranslationProvider):
     """OpenAI-based translation provider."""
 
     def __init__(self):
-        """Initialize OpenAI provider with API key and settings."""
+        """Initialize OpenAI provider with the shared client and settings."""
         self.settings = get_settings()
-        self.client = openai.OpenAI(api_key=self.settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
 
     async def translate_text(self, text: str, target_language: str, guideline: str = "") -> str:
         """
@@ -34,20 +53,19 @@ class OpenAITranslationProvider(BaseTranslationProvider):
             Exception: If translation fails
         """
         logger.info(
-            f"Translating text with OpenAI, text length: {len(text)}, target: {target_language}, "
-            f"guideline: {'provided' if guideline else 'none'}"
+            "Translating text with OpenAI, text length: %d, target: %s, guideline: %s",
+            len(text),
+            target_language,
+            "provided" if guideline else "none",
         )
 
-        # Create system prompt for translation
-        guideline_text = f" {guideline}" if guideline else ""
-        system_prompt = f"""You are a translation assistant.
-        Translate the following text into {target_language}. {guideline_text}
-        Provide only the translated text without any explanations or additional content."""
+        # Get the system prompt for translation
+        system_prompt = _build_system_prompt(target_language, guideline)
 
-        print(system_prompt)
+        logger.debug("System prompt: %s", system_prompt)
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.settings.DEFAULT_TRANSLATION_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -56,14 +74,20 @@ class OpenAITranslationProvider(BaseTranslationProvider):
                 temperature=0.3,  # Lower temperature for more consistent translations
             )
 
-            translated_text = response.choices[0].message.content.strip()
+            content = response.choices[0].message.content
+            if content is None:
+                raise ValueError("OpenAI returned no translated text")
+            # Only strip (and copy) the text when it actually has surrounding whitespace
+            if content[:1].isspace() or content[-1:].isspace():
+                content = content.strip()
+            translated_text = content
             logger.info(
-                f"OpenAI translation successful, translated text length: {len(translated_text)}"
+                "OpenAI translation successful, translated text length: %d", len(translated_text)
             )
             return translated_text
 
         except Exception as e:
-            logger.error(f"OpenAI translation error: {e}", exc_info=True)
+            logger.error("OpenAI translation error: %s", e, exc_info=True)
             raise
 
     def get_provider_name(self) -> str:
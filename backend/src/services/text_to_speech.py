@@ -2,15 +2,27 @@
 Text-to-speech service for converting text to audio.
 """
 
-from typing import AsyncGenerator
+import asyncio
+from collections import deque
+from contextlib import aclosing
+from typing import AsyncGenerator, AsyncIterator
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
 from src.services.voice_providers.factory import create_voice_provider
+from src.utils.text_utils import split_text
 
 # Set up logger
 logger = get_logger(__name__)
 
+# Most text chunks synthesized at the same time, and most audio chunks buffered for each one, so a
+# long text neither opens a stream per chunk at once nor buffers all of its audio in memory
+MAX_CONCURRENT_STREAMS = 3
+STREAM_QUEUE_SIZE = 64
+
+# Settings don't change after startup, so resolve the default provider once
+_DEFAULT_VOICE_PROVIDER = get_settings().VOICE_PROVIDER
+
 
 async def generate_speech(
     text: str,
@@ -30,63 +42,118 @@ async def generate_speech(
     Returns:
         Path to the saved audio file
     """
-    settings = get_settings()
-    provider_name = voice_provider or settings.VOICE_PROVIDER
+    provider_name = voice_provider or _DEFAULT_VOICE_PROVIDER
     logger.info(
-        f"Generating speech using {provider_name}, text length: {len(text)}, "
-        f"output file: {output_file}, voice ID: {voice_id or 'default'}"
+        "Generating speech using %s, text length: %d, output file: %s, voice ID: %s",
+        provider_name,
+        len(text),
+        output_file,
+        voice_id or "default",
     )
 
     try:
-        # Create the voice provider
+        # Get the cached voice provider
         provider = create_voice_provider(provider_name)
 
         # Generate speech using the provider
         result = await provider.generate_speech(text, output_file, voice_id)
 
-        logger.info(f"Speech generation successful using {provider_name}: {result}")
+        logger.info("Speech generation successful using %s: %s", provider_name, result)
         return result
 
     except Exception as e:
-        logger.error(f"Text-to-speech error with {provider_name}: {e}", exc_info=True)
+        logger.error("Text-to-speech error with %s: %s", provider_name, e, exc_info=True)
         raise
 
 
+async def _pump_stream(stream: AsyncIterator[bytes], queue: asyncio.Queue) -> None:
+    """
+    Copy an audio stream into a queue, ending with a None sentinel even if the stream fails.
+
+    Args:
+        stream: Audio stream to read
+        queue: Queue to copy the audio chunks into
+    """
+    try:
+        # Close the provider stream (and its connection) promptly, also when cancelled
+        async with aclosing(stream):
+            async for chunk in stream:
+                await queue.put(chunk)
+    except asyncio.CancelledError:
+        # Cancelled because the consumer is gone, so nobody is waiting for the sentinel
+        raise
+    except Exception:
+        await queue.put(None)
+        raise
+    await queue.put(None)
+
+
 async def generate_speech_stream(
     text: str,
     voice_provider: str = None,
-    voice_id: str = None
+    voice_id: str = None,
+    max_chars: int = 1500,
 ) -> AsyncGenerator[bytes, None]:
     """
     Generate speech from text as a stream using the specified or configured voice provider.
 
+    Long text is split on sentence boundaries and up to MAX_CONCURRENT_STREAMS chunks are
+    synthesized concurrently, while the audio is still yielded in order: the current chunk streams
+    live and the next ones are buffered, up to STREAM_QUEUE_SIZE audio chunks each.
+
     Args:
         text: Text to convert to speech
         voice_provider: Voice provider to use (if None, uses configured provider)
         voice_id: Voice ID to use (if None, uses default for the provider)
+        max_chars: Maximum length of each text chunk sent to the provider
 
     Yields:
         Audio chunks as bytes
     """
-    settings = get_settings()
-    provider_name = voice_provider or settings.VOICE_PROVIDER
+    provider_name = voice_provider or _DEFAULT_VOICE_PROVIDER
     logger.info(
-        f"Generating speech stream using {provider_name}, text length: {len(text)}, "
-        f"voice ID: {voice_id or 'default'}"
+        "Generating speech stream using %s, text length: %d, voice ID: %s",
+        provider_name,
+        len(text),
+        voice_id or "default",
     )
 
     try:
-        # Create the voice provider
+        # Get the cached voice provider
         provider = create_voice_provider(provider_name)
 
-        # Generate speech stream using the provider
-        async for chunk in provider.generate_speech_stream(text, voice_id):
-            yield chunk
+        # Generate speech streams for a window of text chunks ahead and relay them in order
+        text_chunks = split_text(text, max_chars)
+        tasks = []
+        pending = deque()
+
+        def start_next_stream() -> None:
+            queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+            stream = provider.generate_speech_stream(text_chunks[len(tasks)], voice_id)
+            tasks.append(asyncio.create_task(_pump_stream(stream, queue)))
+            pending.append((tasks[-1], queue))
+
+        try:
+            while len(tasks) < min(MAX_CONCURRENT_STREAMS, len(text_chunks)):
+                start_next_stream()
+
+            while pending:
+                task, queue = pending.popleft()
+                while (chunk := await queue.get()) is not None:
+                    yield chunk
+                # Re-raise any error from this chunk's stream
+                await task
+
+                if len(tasks) < len(text_chunks):
+                    start_next_stream()
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        logger.info(f"Speech stream generation successful using {provider_name}")
+        logger.info("Speech stream generation successful using %s", provider_name)
 
     except Exception as e:
-        logger.error(f"Text-to-speech stream error with {provider_name}: {e}", exc_info=True)
+        logger.error("Text-to-speech stream error with %s: %s", provider_name, e, exc_info=True)
         raise
 
 
@@ -97,8 +164,7 @@ def get_current_provider_name() -> str:
     Returns:
         Name of the current voice provider
     """
-    settings = get_settings()
-    return settings.VOICE_PROVIDER
+    return _DEFAULT_VOICE_PROVIDER
 
 
 def validate_provider_configuration() -> bool:
@@ -112,8 +178,8 @@ def validate_provider_configuration() -> bool:
         ValueError: If configuration is invalid
     """
     try:
-        provider = create_voice_provider()
+        provider = create_voice_provider(_DEFAULT_VOICE_PROVIDER)
         return provider.validate_configuration()
     except Exception as e:
-        logger.error(f"Voice provider validation failed: {e}")
+        logger.error("Voice provider validation failed: %s", e)
         raise
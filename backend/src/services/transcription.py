@@ -2,12 +2,12 @@
 Transcription service for converting audio to text.
 """
 
+import logging
 from pathlib import Path
 
-import openai
-
 from src.core.config import get_settings
 from src.core.logging import get_logger
+from src.services.clients import get_openai_client
 
 # Set up logger
 logger = get_logger(__name__)
@@ -24,32 +24,38 @@ async def transcribe_audio(audio_file_path: str) -> str:
         Transcribed text
     """
     settings = get_settings()
-    logger.info(f"Transcribing audio file: {audio_file_path}")
+    logger.info("Transcribing audio file: %s", audio_file_path)
 
-    # Initialize OpenAI client
-    api_key = settings.OPENAI_API_KEY
-    if not api_key:
+    # Get the shared OpenAI client
+    if not settings.OPENAI_API_KEY:
         logger.error("OpenAI API key not found")
         raise ValueError("OpenAI API key not found in environment variables or settings")
 
-    client = openai.OpenAI(api_key=api_key)
-    logger.debug("OpenAI client initialized")
+    client = get_openai_client()
 
-    try:
-        # Ensure audio path exists
-        audio_path = Path(audio_file_path)
-        if not audio_path.exists():
-            logger.error(f"Audio file not found: {audio_path}")
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    audio_path = Path(audio_file_path)
 
+    try:
         logger.debug("Starting transcription with Whisper model")
-        # Perform transcription
+        # Pass the open file rather than its contents; httpx streams the multipart body from it in
+        # 64 KiB chunks, so the whole recording is never held in memory. The plain-text response
+        # format returns the transcript as-is, with no JSON body to parse.
         with open(audio_file_path, "rb") as audio_file:
-            transcript = client.audio.transcriptions.create(model="whisper-1", file=audio_file)
-
-        logger.info(f"Transcription successful, text length: {len(transcript.text)}")
-        logger.debug(f"Transcribed text: {transcript.text[:100]}...")
-        return transcript.text
+            transcript = await client.audio.transcriptions.create(
+                model="whisper-1", file=(audio_path.name, audio_file), response_format="text"
+            )
+
+        # The text format ends with a newline
+        transcribed_text = transcript.strip()
+
+        logger.info("Transcription successful, text length: %d", len(transcribed_text))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Transcribed text: %s...", transcribed_text[:100])
+        return transcribed_text
+    except FileNotFoundError:
+        # open() already checks that the file exists, so there's no separate stat beforehand
+        logger.error("Audio file not found: %s", audio_path)
+        raise FileNotFoundError(f"Audio file not found: {audio_path}") from None
     except Exception as e:
-        logger.error(f"Transcription error: {e}", exc_info=True)
+        logger.error("Transcription error: %s", e, exc_info=True)
         raise
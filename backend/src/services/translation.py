@@ -2,12 +2,39 @@
 Translation service for converting text from one language to another.
 """
 
+import asyncio
+import logging
+import re
+
 from src.core.logging import get_logger
 from src.services.providers.factory import get_translation_provider
+from src.utils.text_utils import split_text_with_separators
 
 # Set up logger
 logger = get_logger(__name__)
 
+# Plausible language names: letters (any script), spaces, hyphens and parentheses, e.g.
+# "English", "pt-BR" or "Chinese (Traditional)"
+_LANG_RE = re.compile(r"[^\W\d_](?:[^\W\d_]|[ ()\-]){1,31}")
+
+# Most chunks of one text translated at the same time, so a long transcript doesn't open a
+# request per chunk all at once
+MAX_CONCURRENT_CHUNKS = 4
+
+
+def validate_target_language(target_language: str) -> None:
+    """
+    Reject target languages that can't be a language name, before paying for a provider call.
+
+    Args:
+        target_language: Target language for translation
+
+    Raises:
+        ValueError: If the target language is not a plausible language name
+    """
+    if not _LANG_RE.fullmatch(target_language):
+        raise ValueError(f"Invalid target language: {target_language!r}")
+
 
 async def translate_text(text: str, target_language: str, guideline: str = "") -> str:
     """
@@ -20,23 +47,90 @@ async def translate_text(text: str, target_language: str, guideline: str = "") -
 
     Returns:
         Translated text
+
+    Raises:
+        ValueError: If the target language is not a plausible language name
     """
-    logger.info(f"Translating text to {target_language}, text length: {len(text)}")
+    validate_target_language(target_language)
+    logger.info("Translating text to %s, text length: %d", target_language, len(text))
 
     try:
         # Get the configured translation provider
         provider = get_translation_provider()
-        logger.debug(f"Using translation provider: {provider.get_provider_name()}")
+        logger.debug("Using translation provider: %s", provider.get_provider_name())
 
         # Perform translation using the provider
         translated_text = await provider.translate_text(text, target_language, guideline)
 
-        logger.info(f"Translation successful, translated text length: {len(translated_text)}")
-        logger.debug(f"Translated text: {translated_text[:100]}...")
+        logger.info("Translation successful, translated text length: %d", len(translated_text))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Translated text: %s...", translated_text[:100])
+        return translated_text
+
+    except Exception as e:
+        logger.error("Translation error: %s", e, exc_info=True)
+        logger.warning("Returning original text due to translation failure")
+        # Return original text if translation fails
+        return text
+
+
+async def translate_text_chunked(
+    text: str, target_language: str, guideline: str = "", max_chars: int = 1500
+) -> str:
+    """
+    Translate long text by splitting it on sentence boundaries and translating chunks concurrently,
+    at most MAX_CONCURRENT_CHUNKS at a time.
+
+    Short texts are translated with a single call, exactly like translate_text.
+
+    Args:
+        text: Text to translate
+        target_language: Target language for translation
+        guideline: Additional translation guidelines (optional)
+        max_chars: Maximum length of each chunk sent to the provider
+
+    Returns:
+        Translated text
+
+    Raises:
+        ValueError: If the target language is not a plausible language name
+    """
+    validate_target_language(target_language)
+    chunks = split_text_with_separators(text, max_chars)
+    if len(chunks) == 1:
+        return await translate_text(text, target_language, guideline)
+
+    logger.info(
+        "Translating text to %s in %d chunks, text length: %d",
+        target_language,
+        len(chunks),
+        len(text),
+    )
+
+    try:
+        # Reuse the cached provider so every chunk shares one connection pool
+        provider = get_translation_provider()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+
+        async def translate_chunk(chunk: str) -> str:
+            async with semaphore:
+                return await provider.translate_text(chunk, target_language, guideline)
+
+        # A task group cancels the other chunks' requests as soon as one fails, since the whole
+        # text then falls back to the original
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(translate_chunk(chunk)) for chunk, _ in chunks]
+        translated_chunks = [task.result() for task in tasks]
+
+        # Rejoin with the original separators, so e.g. CJK sentences aren't split by spaces
+        translated_text = "".join(
+            translated + separator for translated, (_, separator) in zip(translated_chunks, chunks)
+        )
+        logger.info("Chunked translation successful, translated text length: %d", len(translated_text))
         return translated_text
 
     except Exception as e:
-        logger.error(f"Translation error: {e}", exc_info=True)
+        logger.error("Chunked translation error: %s", e, exc_info=True)
         logger.warning("Returning original text due to translation failure")
         # Return original text if translation fails
         return text
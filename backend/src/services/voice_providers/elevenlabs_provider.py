@@ -2,17 +2,30 @@
 ElevenLabs voice provider implementation.
 """
 
-from typing import AsyncGenerator
+import asyncio
+import base64
+import json
+from typing import AsyncGenerator, AsyncIterable, Final
+from urllib.parse import urlencode
 
-from elevenlabs.client import ElevenLabs
+import websockets
+from elevenlabs.client import AsyncElevenLabs
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
+from src.services.clients import get_http_client
+from src.utils.file_utils import write_audio_stream
 
 from .base import VoiceProvider
 
 logger = get_logger(__name__)
 
+# Audio format requested from every ElevenLabs endpoint
+_OUTPUT_FORMAT: Final = "mp3_44100_128"
+
+# WebSocket endpoint that accepts the text to synthesize incrementally
+STREAM_INPUT_URL = "wss://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream-input"
+
 
 class ElevenLabsProvider(VoiceProvider):
     """ElevenLabs voice provider implementation."""
@@ -21,18 +34,28 @@ class ElevenLabsProvider(VoiceProvider):
         """Initialize the ElevenLabs provider."""
         self.settings = get_settings()
         self.client = None
+        # Settings don't change after startup, so resolve the defaults used on every call once
+        self._default_voice_id = self.settings.DEFAULT_VOICE_ID
+        self._model_id = self.settings.DEFAULT_TTS_MODEL
+        self._streaming_model_id = self.settings.DEFAULT_STREAMING_TTS_MODEL
         self._initialize_client()
 
     def _initialize_client(self) -> None:
         """Initialize the ElevenLabs client."""
         try:
-            if not self.settings.ELEVENLABS_API_KEY:
-                raise ValueError("ELEVENLABS_API_KEY is not configured")
-
-            self.client = ElevenLabs(api_key=self.settings.ELEVENLABS_API_KEY)
+            # Checked here rather than in Settings, so the key is only required when ElevenLabs is used
+            api_key = self.settings.require_api_key("ELEVENLABS_API_KEY", "elevenlabs")
+            self._api_key = api_key
+            if not self._default_voice_id:
+                raise ValueError("DEFAULT_VOICE_ID is required for ElevenLabs provider")
+            if not self._model_id:
+                raise ValueError("DEFAULT_TTS_MODEL is required for ElevenLabs provider")
+
+            # Share the process-wide HTTP client so synthesis requests reuse warm TLS connections
+            self.client = AsyncElevenLabs(api_key=api_key, httpx_client=get_http_client())
             logger.debug("ElevenLabs client initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize ElevenLabs client: {e}")
+            logger.error("Failed to initialize ElevenLabs client: %s", e)
             raise
 
     async def generate_speech(self, text: str, output_file: str, voice_id: str = None) -> str:
@@ -51,7 +74,9 @@ class ElevenLabsProvider(VoiceProvider):
             Exception: If speech generation fails
         """
         logger.info(
-            f"Generating speech with ElevenLabs, text length: {len(text)}, output: {output_file}"
+            "Generating speech with ElevenLabs, text length: %d, output: %s",
+            len(text),
+            output_file,
         )
 
         try:
@@ -59,33 +84,30 @@ class ElevenLabsProvider(VoiceProvider):
                 self._initialize_client()
 
             # Get voice and model settings
-            voice_id = voice_id or self.settings.DEFAULT_VOICE_ID
-            model_id = self.settings.DEFAULT_TTS_MODEL
-            output_format = "mp3_44100_128"
-            logger.debug(f"Using voice ID: {voice_id}, model ID: {model_id}")
+            voice_id = voice_id or self._default_voice_id
+            model_id = self._model_id
+            logger.debug("Using voice ID: %s, model ID: %s", voice_id, model_id)
 
-            # Generate speech using ElevenLabs TTS API
-            audio_iterator = self.client.text_to_speech.convert(
+            # Stream speech from the ElevenLabs TTS API
+            audio_iterator = self.client.text_to_speech.stream(
                 text=text,
                 voice_id=voice_id,
                 model_id=model_id,
-                output_format=output_format,
+                output_format=_OUTPUT_FORMAT,
             )
 
-            # Save to file by writing all chunks
-            chunk_count = 0
-            with open(output_file, "wb") as f:
-                for chunk in audio_iterator:
-                    f.write(chunk)
-                    chunk_count += 1
+            # Save to file as chunks arrive, batching them into large writes
+            chunk_count = await write_audio_stream(audio_iterator, output_file)
 
             logger.info(
-                f"ElevenLabs speech generation successful, wrote {chunk_count} chunks to {output_file}"
+                "ElevenLabs speech generation successful, wrote %d chunks to %s",
+                chunk_count,
+                output_file,
             )
             return output_file
 
         except Exception as e:
-            logger.error(f"ElevenLabs speech generation error: {e}", exc_info=True)
+            logger.error("ElevenLabs speech generation error: %s", e, exc_info=True)
             raise
 
     async def generate_speech_stream(self, text: str, voice_id: str = None) -> AsyncGenerator[bytes, None]:
@@ -102,38 +124,117 @@ class ElevenLabsProvider(VoiceProvider):
         Raises:
             Exception: If speech generation fails
         """
-        logger.info(f"Generating speech stream with ElevenLabs, text length: {len(text)}")
+        logger.info("Generating speech stream with ElevenLabs, text length: %d", len(text))
 
         try:
             if not self.client:
                 self._initialize_client()
 
             # Get voice and model settings
-            voice_id = voice_id or self.settings.DEFAULT_VOICE_ID
-            model_id = self.settings.DEFAULT_TTS_MODEL
-            output_format = "mp3_44100_128"
-            logger.debug(f"Using voice ID: {voice_id}, model ID: {model_id}")
+            voice_id = voice_id or self._default_voice_id
+            model_id = self._model_id
+            logger.debug("Using voice ID: %s, model ID: %s", voice_id, model_id)
 
-            # Generate speech using ElevenLabs TTS API
-            audio_iterator = self.client.text_to_speech.convert(
+            # Stream speech from the ElevenLabs TTS API
+            audio_iterator = self.client.text_to_speech.stream(
                 text=text,
                 voice_id=voice_id,
                 model_id=model_id,
-                output_format=output_format,
+                output_format=_OUTPUT_FORMAT,
             )
 
             # Yield chunks as they come
             chunk_count = 0
-            for chunk in audio_iterator:
+            async for chunk in audio_iterator:
                 yield chunk
                 chunk_count += 1
 
             logger.info(
-                f"ElevenLabs speech stream generation successful, yielded {chunk_count} chunks"
+                "ElevenLabs speech stream generation successful, yielded %d chunks", chunk_count
             )
 
         except Exception as e:
-            logger.error(f"ElevenLabs speech stream generation error: {e}", exc_info=True)
+            logger.error("ElevenLabs speech stream generation error: %s", e, exc_info=True)
+            raise
+
+    async def generate_speech_from_stream(
+        self, text_stream: AsyncIterable[str], voice_id: str = None
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Generate speech from text that arrives incrementally, using the ElevenLabs stream-input
+        WebSocket API.
+
+        Text is sent as it is produced (e.g. as translation tokens arrive), so synthesis starts
+        before the full text is known. Sending and receiving run concurrently.
+
+        Args:
+            text_stream: Text fragments to convert to speech, in order
+            voice_id: Voice ID to use (if None, uses default voice)
+
+        Yields:
+            Audio chunks as bytes
+
+        Raises:
+            Exception: If speech generation fails
+        """
+        logger.info("Generating speech from text stream with ElevenLabs")
+
+        try:
+            # The stream-input API doesn't support every model, so it has its own model setting
+            voice_id = voice_id or self._default_voice_id
+            model_id = self._streaming_model_id
+            logger.debug("Using voice ID: %s, model ID: %s", voice_id, model_id)
+
+            query = urlencode({"model_id": model_id, "output_format": _OUTPUT_FORMAT})
+            uri = f"{STREAM_INPUT_URL.format(voice_id=voice_id)}?{query}"
+
+            async with websockets.connect(uri) as websocket:
+                # The first message opens the stream and authenticates it
+                await websocket.send(
+                    json.dumps({"text": " ", "xi_api_key": self._api_key})
+                )
+
+                async def send_text() -> None:
+                    try:
+                        async for text in text_stream:
+                            if text:
+                                await websocket.send(json.dumps({"text": text}))
+                        # An empty text message flushes the remaining audio and ends the stream
+                        await websocket.send(json.dumps({"text": ""}))
+                    except Exception:
+                        # Close the socket so the receive loop below ends instead of waiting for
+                        # audio that will never come; the error is re-raised when sender is awaited
+                        await websocket.close()
+                        raise
+
+                sender = asyncio.create_task(send_text())
+
+                try:
+                    chunk_count = 0
+                    async for message in websocket:
+                        data = json.loads(message)
+                        if data.get("audio"):
+                            yield base64.b64decode(data["audio"])
+                            chunk_count += 1
+                        elif data.get("error") or data.get("message"):
+                            # The server reports failures (e.g. a bad key or voice) in a frame
+                            # without audio, then closes the socket
+                            error = data.get("error") or data.get("message")
+                            raise RuntimeError(f"ElevenLabs stream-input error: {error}")
+                        if data.get("isFinal"):
+                            break
+
+                    # Surface any error from the sending side
+                    await sender
+                finally:
+                    sender.cancel()
+
+            logger.info(
+                "ElevenLabs text stream speech generation successful, yielded %d chunks", chunk_count
+            )
+
+        except Exception as e:
+            logger.error("ElevenLabs text stream speech generation error: %s", e, exc_info=True)
             raise
 
     def get_provider_name(self) -> str:
@@ -144,19 +245,10 @@ class ElevenLabsProvider(VoiceProvider):
         """
         Validate that the ElevenLabs provider is properly configured.
 
+        The API key, voice and model are checked once when the client is initialized, so a
+        constructed provider is always valid.
+
         Returns:
             True if configuration is valid
-
-        Raises:
-            ValueError: If configuration is invalid
         """
-        if not self.settings.ELEVENLABS_API_KEY:
-            raise ValueError("ELEVENLABS_API_KEY is required for ElevenLabs provider")
-
-        if not self.settings.DEFAULT_VOICE_ID:
-            raise ValueError("DEFAULT_VOICE_ID is required for ElevenLabs provider")
-
-        if not self.settings.DEFAULT_TTS_MODEL:
-            raise ValueError("DEFAULT_TTS_MODEL is required for ElevenLabs provider")
-
         return True
@@ -2,6 +2,8 @@
 Voice provider factory for creating voice provider instances.
 """
 
+import threading
+
 from src.core.config import get_settings
 from src.core.logging import get_logger
 
@@ -11,10 +13,16 @@ from .hume_provider import HumeProvider
 
 logger = get_logger(__name__)
 
+# Voice provider instances by name, so their SDK clients are built and validated only once
+_PROVIDERS: dict[str, VoiceProvider] = {}
+_PROVIDERS_LOCK = threading.Lock()
+
 
 def create_voice_provider(provider_name: str = None) -> VoiceProvider:
     """
-    Create a voice provider instance based on configuration or specified provider.
+    Get the voice provider instance for the configured or specified provider.
+
+    Providers are created and validated on first use and cached, so later calls are a dict lookup.
 
     Args:
         provider_name: Name of the voice provider to create (if None, uses configured provider)
@@ -26,10 +34,39 @@ def create_voice_provider(provider_name: str = None) -> VoiceProvider:
         ValueError: If an unsupported provider is specified
         Exception: If provider initialization fails
     """
-    settings = get_settings()
-    provider_name = (provider_name or settings.VOICE_PROVIDER).lower()
+    provider_name = (provider_name or get_settings().VOICE_PROVIDER).lower()
+
+    provider = _PROVIDERS.get(provider_name)
+    if provider is None:
+        with _PROVIDERS_LOCK:
+            provider = _PROVIDERS.get(provider_name)
+            if provider is None:
+                provider = _build_voice_provider(provider_name)
+                _PROVIDERS[provider_name] = provider
+    return provider
 
-    logger.info(f"Creating voice provider: {provider_name}")
+
+def reset_voice_providers() -> None:
+    """Forget the cached voice providers, e.g. after their API clients have been closed."""
+    with _PROVIDERS_LOCK:
+        _PROVIDERS.clear()
+
+
+def _build_voice_provider(provider_name: str) -> VoiceProvider:
+    """
+    Create and validate a new voice provider instance.
+
+    Args:
+        provider_name: Lowercase name of the voice provider to create
+
+    Returns:
+        VoiceProvider: The new voice provider instance
+
+    Raises:
+        ValueError: If an unsupported provider is specified
+        Exception: If provider initialization fails
+    """
+    logger.info("Creating voice provider: %s", provider_name)
 
     try:
         if provider_name == "hume":
@@ -42,14 +79,12 @@ def create_voice_provider(provider_name: str = None) -> VoiceProvider:
                 "Supported providers: hume, elevenlabs"
             )
 
-        # Validate configuration
-        provider.validate_configuration()
-
-        logger.info(f"Voice provider '{provider_name}' created and validated successfully")
+        # Configuration is validated by the provider's constructor
+        logger.info("Voice provider '%s' created and validated successfully", provider_name)
         return provider
 
     except Exception as e:
-        logger.error(f"Failed to create voice provider '{provider_name}': {e}")
+        logger.error("Failed to create voice provider '%s': %s", provider_name, e)
         raise
 
 
@@ -2,18 +2,23 @@
 Hume voice provider implementation.
 """
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Final
 
-from hume import HumeClient
+from hume import AsyncHumeClient
 from hume.tts import FormatMp3
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
+from src.services.clients import get_http_client
+from src.utils.file_utils import write_audio_stream
 
 from .base import VoiceProvider
 
 logger = get_logger(__name__)
 
+# Output format for every synthesis request; the format model is immutable, so it is built once
+_MP3_FORMAT: Final = FormatMp3()
+
 
 class HumeProvider(VoiceProvider):
     """Hume voice provider implementation."""
@@ -22,18 +27,25 @@ class HumeProvider(VoiceProvider):
         """Initialize the Hume provider."""
         self.settings = get_settings()
         self.client = None
+        # Settings don't change after startup, so resolve the default voice once; its payload is
+        # shared by every request that uses it
+        self._default_voice_id = self.settings.HUME_VOICE_ID
+        self._default_voice = {"id": self._default_voice_id}
         self._initialize_client()
 
     def _initialize_client(self) -> None:
         """Initialize the Hume client."""
         try:
-            if not self.settings.HUME_API_KEY:
-                raise ValueError("HUME_API_KEY is not configured")
+            # Checked here rather than in Settings, so the key is only required when Hume is used
+            api_key = self.settings.require_api_key("HUME_API_KEY", "hume")
+            if not self._default_voice_id:
+                raise ValueError("HUME_VOICE_ID is required for Hume provider")
 
-            self.client = HumeClient(api_key=self.settings.HUME_API_KEY)
+            # Share the process-wide HTTP client so synthesis requests reuse warm TLS connections
+            self.client = AsyncHumeClient(api_key=api_key, httpx_client=get_http_client())
             logger.debug("Hume client initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize Hume client: {e}")
+            logger.error("Failed to initialize Hume client: %s", e)
             raise
 
     async def generate_speech(self, text: str, output_file: str, voice_id: str = None) -> str:
@@ -51,37 +63,38 @@ class HumeProvider(VoiceProvider):
         Raises:
             Exception: If speech generation fails
         """
-        logger.info(f"Generating speech with Hume, text length: {len(text)}, output: {output_file}")
+        logger.info(
+            "Generating speech with Hume, text length: %d, output: %s", len(text), output_file
+        )
 
         try:
             if not self.client:
                 self._initialize_client()
 
             # Use provided voice_id or default
-            voice_id = voice_id or self.settings.HUME_VOICE_ID
-            logger.debug(f"Using Hume voice ID: {voice_id}")
+            voice_id = voice_id or self._default_voice_id
+            logger.debug("Using Hume voice ID: %s", voice_id)
 
-            # Generate speech using Hume TTS API
-            response = self.client.tts.synthesize_file(
-                format=FormatMp3(),
+            # Stream speech from the Hume TTS API; strip_headers makes the chunks one MP3 file
+            response = self.client.tts.synthesize_file_streaming(
+                format=_MP3_FORMAT,
                 num_generations=1,
-                utterances=[{"text": text, "voice": {"id": voice_id}}],
+                strip_headers=True,
+                utterances=[{"text": text, "voice": self._get_voice(voice_id)}],
             )
 
-            # Save the response to file
-            chunk_count = 0
-            with open(output_file, "wb") as f:
-                for chunk in response:
-                    f.write(chunk)
-                    chunk_count += 1
+            # Save to file as chunks arrive, batching them into large writes
+            chunk_count = await write_audio_stream(response, output_file)
 
             logger.info(
-                f"Hume speech generation successful, wrote {chunk_count} chunks to {output_file}"
+                "Hume speech generation successful, wrote %d chunks to %s",
+                chunk_count,
+                output_file,
             )
             return output_file
 
         except Exception as e:
-            logger.error(f"Hume speech generation error: {e}", exc_info=True)
+            logger.error("Hume speech generation error: %s", e, exc_info=True)
             raise
 
     async def generate_speech_stream(self, text: str, voice_id: str = None) -> AsyncGenerator[bytes, None]:
@@ -98,35 +111,50 @@ class HumeProvider(VoiceProvider):
         Raises:
             Exception: If speech generation fails
         """
-        logger.info(f"Generating speech stream with Hume, text length: {len(text)}")
+        logger.info("Generating speech stream with Hume, text length: %d", len(text))
 
         try:
             if not self.client:
                 self._initialize_client()
 
             # Use provided voice_id or default
-            voice_id = voice_id or self.settings.HUME_VOICE_ID
-            logger.debug(f"Using Hume voice ID: {voice_id}")
+            voice_id = voice_id or self._default_voice_id
+            logger.debug("Using Hume voice ID: %s", voice_id)
 
-            # Generate speech using Hume TTS API
-            response = self.client.tts.synthesize_file(
-                format=FormatMp3(),
+            # Stream speech from the Hume TTS API; strip_headers makes the chunks one MP3 file
+            response = self.client.tts.synthesize_file_streaming(
+                format=_MP3_FORMAT,
                 num_generations=1,
-                utterances=[{"text": text, "voice": {"id": voice_id}}],
+                strip_headers=True,
+                utterances=[{"text": text, "voice": self._get_voice(voice_id)}],
             )
 
             # Yield chunks as they come
             chunk_count = 0
-            for chunk in response:
+            async for chunk in response:
                 yield chunk
                 chunk_count += 1
 
-            logger.info(f"Hume speech stream generation successful, yielded {chunk_count} chunks")
+            logger.info("Hume speech stream generation successful, yielded %d chunks", chunk_count)
 
         except Exception as e:
-            logger.error(f"Hume speech stream generation error: {e}", exc_info=True)
+            logger.error("Hume speech stream generation error: %s", e, exc_info=True)
             raise
 
+    def _get_voice(self, voice_id: str) -> dict:
+        """
+        Get the voice payload for a voice ID, reusing the prebuilt one for the default voice.
+
+        Args:
+            voice_id: Voice ID to use
+
+        Returns:
+            Voice specification for a Hume utterance
+        """
+        if voice_id == self._default_voice_id:
+            return self._default_voice
+        return {"id": voice_id}
+
     def get_provider_name(self) -> str:
         """Get the name of the voice provider."""
         return "hume"
@@ -135,16 +163,10 @@ class HumeProvider(VoiceProvider):
         """
         Validate that the Hume provider is properly configured.
 
+        The API key and voice are checked once when the client is initialized, so a constructed
+        provider is always valid.
+
         Returns:
             True if configuration is valid
-
-        Raises:
-            ValueError: If configuration is invalid
         """
-        if not self.settings.HUME_API_KEY:
-            raise ValueError("HUME_API_KEY is required for Hume provider")
-
-        if not self.settings.HUME_VOICE_ID:
-            raise ValueError("HUME_VOICE_ID is required for Hume provider")
-
         return True
@@ -2,12 +2,16 @@
 Utility functions for file handling.
 """
 
+import asyncio
+import io
+import itertools
 import os
-import shutil
-import uuid
-from datetime import datetime
+import time
 from pathlib import Path
+from secrets import token_hex
+from typing import AsyncIterable
 
+import aiofiles
 from fastapi import UploadFile
 
 from src.core.config import get_settings
@@ -16,6 +20,73 @@ from src.core.logging import get_logger
 # Set up logger
 logger = get_logger(__name__)
 
+# Extensions accepted on uploads as is; anything else gets .wav appended
+VALID_AUDIO_EXTENSIONS = (".mp3", ".wav", ".m4a")
+
+# Chunk size used when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Streamed audio is batched until this many bytes are pending before each write to disk
+AUDIO_WRITE_BATCH_SIZE = 256 * 1024
+
+# Most buffers a single writev call accepts; sysconf reports -1 when the limit is indeterminate
+try:
+    _IOV_MAX = max(os.sysconf("SC_IOV_MAX"), 16)
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+# Uploads are named from a per-process counter; the start time and PID keep names unique across
+# worker processes and restarts
+_START_TIME = int(time.time())
+_upload_counter = itertools.count()
+
+# Temp directories are resolved once on the settings and created at startup (see create_directories)
+settings = get_settings()
+
+
+def _make_upload_prefix() -> str:
+    """
+    Generate a unique file name prefix for an upload, without drawing on OS entropy.
+
+    Returns:
+        File name prefix: process start time, PID and a counter, e.g. 1735732800_4242_1f
+    """
+    return f"{_START_TIME}_{os.getpid()}_{next(_upload_counter):x}"
+
+
+def _make_file_prefix() -> str:
+    """
+    Generate an unguessable file name prefix: the local time to the minute and 8 random hex digits.
+
+    Output files are served by name, so they keep a random part rather than a predictable counter.
+
+    Returns:
+        File name prefix, e.g. 20250101_1200_1a2b3c4d
+    """
+    return f"{time.strftime('%Y%m%d_%H%M')}_{token_hex(4)}"
+
+
+def _sendfile_to_path(src_fd: int, dest_path: Path) -> None:
+    """
+    Copy a file descriptor's full contents to a path with os.sendfile, inside the kernel.
+
+    Args:
+        src_fd: File descriptor of the source file
+        dest_path: Path of the file to write
+
+    Raises:
+        OSError: If sendfile is not supported for these files
+    """
+    size = os.fstat(src_fd).st_size
+    with open(dest_path, "wb") as dest:
+        # Explicit offsets leave the source file position untouched
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dest.fileno(), src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+
 
 async def save_upload_file(upload_file: UploadFile) -> str:
     """
@@ -27,37 +98,117 @@ async def save_upload_file(upload_file: UploadFile) -> str:
     Returns:
         Path to the saved file
     """
-    settings = get_settings()
-    logger.info(f"Saving uploaded file: {upload_file.filename}")
+    logger.info("Saving uploaded file: %s", upload_file.filename)
 
-    # Generate unique filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-    unique_id = str(uuid.uuid4())[:8]
-    file_prefix = f"{timestamp}_{unique_id}"
-    logger.debug(f"Generated file prefix: {file_prefix}")
+    # Generate unique filename; uploads are never served, so a counter is enough
+    file_prefix = _make_upload_prefix()
+    logger.debug("Generated file prefix: %s", file_prefix)
 
     # Get original filename and ensure it has a valid extension
     filename = upload_file.filename or "audio.wav"
-    if not any(filename.endswith(ext) for ext in [".mp3", ".wav", ".m4a"]):
-        logger.debug(f"Adding .wav extension to filename: {filename}")
+    if not filename.lower().endswith(VALID_AUDIO_EXTENSIONS):
+        logger.debug("Adding .wav extension to filename: %s", filename)
         filename = f"{filename}.wav"
 
     # Create full path for saving
-    temp_input_path = settings.TEMP_DIR / "input" / f"{file_prefix}_{filename}"
-    logger.debug(f"Saving file to: {temp_input_path}")
+    temp_input_path = settings.INPUT_DIR / f"{file_prefix}_{filename}"
+    logger.debug("Saving file to: %s", temp_input_path)
+
+    # Uploads bigger than Starlette's 1 MiB spool limit are already in a temp file; copy that with
+    # sendfile in a thread instead of reading it back through Python. Smaller uploads are in memory,
+    # where asking for a file descriptor would first write them out to disk
+    if hasattr(os, "sendfile") and (upload_file.size or 0) > UPLOAD_CHUNK_SIZE:
+        try:
+            src_fd = upload_file.file.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            src_fd = None
 
-    # Save the file
+        if src_fd is not None:
+            try:
+                await asyncio.to_thread(_sendfile_to_path, src_fd, temp_input_path)
+                logger.info("File saved successfully to: %s", temp_input_path)
+                return str(temp_input_path)
+            except OSError as e:
+                logger.debug("sendfile unavailable, falling back to chunked copy: %s", e)
+
+    # Stream the file to disk in fixed-size chunks to keep memory use constant
     try:
-        with open(temp_input_path, "wb") as buffer:
-            shutil.copyfileobj(upload_file.file, buffer)
-        logger.info(f"File saved successfully to: {temp_input_path}")
+        async with aiofiles.open(temp_input_path, "wb") as buffer:
+            while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
+        logger.info("File saved successfully to: %s", temp_input_path)
     except Exception as e:
-        logger.error(f"Error saving file: {e}", exc_info=True)
+        logger.error("Error saving file: %s", e, exc_info=True)
         raise
 
     return str(temp_input_path)
 
 
+def _write_all(fd: int, buffers: list[bytes]) -> None:
+    """
+    Write buffers to a file descriptor in order, with one writev call where possible.
+
+    Args:
+        fd: File descriptor to write to
+        buffers: Data to write
+    """
+    if not hasattr(os, "writev"):
+        data = memoryview(b"".join(buffers))
+        while data:
+            data = data[os.write(fd, data) :]
+        return
+
+    pending = [memoryview(buffer) for buffer in buffers]
+    while pending:
+        written = os.writev(fd, pending)
+        # Drop what a short write did get through and retry the rest
+        while pending and written >= len(pending[0]):
+            written -= len(pending[0])
+            pending.pop(0)
+        if pending and written:
+            pending[0] = pending[0][written:]
+
+
+async def write_audio_stream(chunks: AsyncIterable[bytes], output_file: str) -> int:
+    """
+    Write a stream of audio chunks to a file.
+
+    TTS APIs stream audio in chunks of a few KB; references to them are batched and each batch of
+    AUDIO_WRITE_BATCH_SIZE bytes is written with a single writev call in a worker thread, rather
+    than one write per chunk or copying them into a buffer first. Opening, writing and closing the
+    file all happen off the event loop, so concurrent requests don't wait on each other's disk IO.
+
+    Args:
+        chunks: Audio chunks, in order
+        output_file: Path to save the audio file
+
+    Returns:
+        Number of chunks written
+    """
+    chunk_count = 0
+    batch: list[bytes] = []
+    batch_size = 0
+    fd = await asyncio.to_thread(os.open, output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        async for chunk in chunks:
+            chunk_count += 1
+            batch.append(chunk)
+            batch_size += len(chunk)
+            if batch_size >= AUDIO_WRITE_BATCH_SIZE or len(batch) >= _IOV_MAX:
+                await asyncio.to_thread(_write_all, fd, batch)
+                batch = []
+                batch_size = 0
+
+        if batch:
+            await asyncio.to_thread(_write_all, fd, batch)
+    finally:
+        # Closing can block too (e.g. on network filesystems); the thread finishes even if this
+        # task is cancelled, so the descriptor is never leaked
+        await asyncio.to_thread(os.close, fd)
+
+    return chunk_count
+
+
 def generate_output_path(extension: str = "mp3") -> str:
     """
     Generate a path for an output file.
@@ -68,21 +219,56 @@ def generate_output_path(extension: str = "mp3") -> str:
     Returns:
         Path to the output file
     """
-    settings = get_settings()
-    logger.debug(f"Generating output path with extension: {extension}")
+    logger.debug("Generating output path with extension: %s", extension)
 
     # Generate unique filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-    unique_id = str(uuid.uuid4())[:8]
-    file_prefix = f"{timestamp}_{unique_id}"
+    file_prefix = _make_file_prefix()
 
     # Create full path for output
-    output_path = os.path.join(settings.TEMP_DIR, "output", f"{file_prefix}.{extension}")
-    logger.debug(f"Generated output path: {output_path}")
+    output_path = settings.OUTPUT_DIR / f"{file_prefix}.{extension}"
+    logger.debug("Generated output path: %s", output_path)
 
     return str(output_path)
 
 
+async def get_audio_duration(file_path: str) -> float:
+    """
+    Get the duration of an audio file from its container metadata.
+
+    Uses ffprobe so only the file headers are read, instead of decoding the whole file.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        RuntimeError: If ffprobe fails or reports no duration
+    """
+    process = await asyncio.create_subprocess_exec(
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "default=nw=1:nk=1",
+        file_path,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+
+    if process.returncode != 0:
+        raise RuntimeError(f"ffprobe failed: {stderr.decode(errors='replace').strip()}")
+
+    try:
+        return float(stdout)
+    except ValueError:
+        raise RuntimeError(f"ffprobe returned no duration for {file_path}")
+
+
 def get_file_url(file_path: str) -> str:
     """
     Convert a file path to a URL for API access.
@@ -93,14 +279,11 @@ def get_file_url(file_path: str) -> str:
     Returns:
         URL to access the file
     """
-    # Convert path to Path object for easier manipulation
-    path = Path(file_path)
-
-    # Extract the filename
-    filename = path.name
+    # Extract the filename; paths come from generate_output_path, so they use the OS separator
+    filename = file_path.rpartition(os.sep)[2]
 
     # Create URL
     url = f"/api/audio/{filename}"
-    logger.debug(f"Generated URL for file {file_path}: {url}")
+    logger.debug("Generated URL for file %s: %s", file_path, url)
 
     return url
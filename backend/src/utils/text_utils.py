@@ -0,0 +1,67 @@
+"""
+Utility functions for text handling.
+"""
+
+import re
+
+# Sentence boundaries: whitespace after Latin terminal punctuation, or right after CJK punctuation
+# (taking any whitespace that follows it)
+SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+|(?<=[。！？])\s*")
+
+
+def split_text(text: str, max_chars: int) -> list[str]:
+    """
+    Split text into chunks of whole sentences, each at most max_chars long where possible.
+
+    Sentences are packed greedily into chunks; a single sentence longer than max_chars becomes a
+    chunk of its own rather than being cut mid-sentence.
+
+    Args:
+        text: Text to split
+        max_chars: Target maximum length of each chunk
+
+    Returns:
+        List of chunks, in order (a single chunk if the text is already short enough)
+    """
+    return [chunk for chunk, _ in split_text_with_separators(text, max_chars)]
+
+
+def split_text_with_separators(text: str, max_chars: int) -> list[tuple[str, str]]:
+    """
+    Split text like split_text, also returning the whitespace removed after each chunk.
+
+    Joining each chunk with its separator gives back the original text, so processed chunks can be
+    rejoined the same way: with a space or newline after Latin punctuation, and with nothing after
+    CJK punctuation.
+
+    Args:
+        text: Text to split
+        max_chars: Target maximum length of each chunk
+
+    Returns:
+        List of (chunk, separator) pairs, in order; the last separator is empty
+    """
+    text = text.strip()
+    if len(text) <= max_chars:
+        return [(text, "")]
+
+    # Keep each sentence's trailing whitespace, so chunks join back without inventing separators
+    sentences = []
+    start = 0
+    for match in SENTENCE_BOUNDARY_RE.finditer(text):
+        sentences.append(text[start : match.end()])
+        start = match.end()
+    sentences.append(text[start:])
+
+    chunks = []
+    current = ""
+    for sentence in sentences:
+        if current and len(current) + len(sentence.rstrip()) > max_chars:
+            chunk = current.rstrip()
+            chunks.append((chunk, current[len(chunk) :]))
+            current = ""
+        current += sentence
+    if current.strip():
+        chunks.append((current.rstrip(), ""))
+
+    return chunks
@@ -15,10 +15,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.app import create_application
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
     """
-    Create a FastAPI application for testing.
+    Create a FastAPI application for testing, shared by the whole test session.
 
     Returns:
         FastAPI: Application instance
@@ -26,18 +26,22 @@ def app():
     return create_application()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):
     """
-    Create a test client for the FastAPI application.
+    Create a test client for the FastAPI application, shared by the whole test session.
+
+    The client is used as a context manager so the application's lifespan runs once, setting up
+    the directories and audio executor that the routes use.
 
     Args:
         app: FastAPI application
 
-    Returns:
+    Yields:
         TestClient: Test client
     """
-    return TestClient(app)
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture
@@ -65,4 +69,3 @@ def pytest_configure(config):
     warnings.filterwarnings("ignore", category=DeprecationWarning)
     warnings.filterwarnings("ignore", message=".*asyncio_default_fixture_loop_scope.*")
     warnings.filterwarnings("ignore", message=".*Support for class-based `config` is deprecated.*")
-    warnings.filterwarnings("ignore", message=".*'audioop' is deprecated.*")
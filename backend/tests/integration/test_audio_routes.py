@@ -3,9 +3,55 @@ Integration tests for audio processing routes.
 """
 
 import os
+from pathlib import Path
 
+import pytest
 from fastapi import status
 
+from src.core.config import get_settings
+from src.services.voice_providers import factory
+from src.services.voice_providers.base import VoiceProvider
+
+
+class FakeVoiceProvider(VoiceProvider):
+    """Voice provider that streams each word of the text as an audio chunk, without network calls."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+
+    async def generate_speech(self, text: str, output_file: str, voice_id: str = None) -> str:
+        chunks = [chunk async for chunk in self.generate_speech_stream(text, voice_id)]
+        Path(output_file).write_bytes(b"".join(chunks))
+        return output_file
+
+    async def generate_speech_stream(self, text: str, voice_id: str = None):
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        for word in text.split():
+            yield word.encode()
+
+    def get_provider_name(self) -> str:
+        return "fake"
+
+    def validate_configuration(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def fake_voice_provider(monkeypatch):
+    """
+    Install a fake provider as the configured voice provider.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+
+    Returns:
+        FakeVoiceProvider: The installed provider
+    """
+    provider = FakeVoiceProvider()
+    monkeypatch.setitem(factory._PROVIDERS, get_settings().VOICE_PROVIDER, provider)
+    return provider
+
 
 def test_process_audio_endpoint(client, test_audio_file):
     """
@@ -128,3 +174,48 @@ def test_get_audio_nonexistent_file(client):
 
     # Check status code
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_stream_audio_endpoint(client, fake_voice_provider):
+    """
+    Test that the /api/audio/stream endpoint streams the provider's audio chunks in order.
+
+    Args:
+        client: Test client
+        fake_voice_provider: Fake voice provider
+    """
+    response = client.post("/api/audio/stream", json={"text": "one two three"})
+
+    assert response.status_code == status.HTTP_200_OK, f"Response: {response.text}"
+    assert response.headers["content-type"] == "audio/mpeg"
+    assert response.headers["x-accel-buffering"] == "no"
+    assert response.content == b"onetwothree"
+
+
+def test_stream_audio_unknown_provider(client):
+    """
+    Test that the /api/audio/stream endpoint rejects an unknown voice provider.
+
+    Args:
+        client: Test client
+    """
+    response = client.post("/api/audio/stream", json={"text": "hello", "voice_provider": "nope"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Unsupported voice provider" in response.json()["detail"]
+
+
+def test_stream_audio_provider_failure(client, fake_voice_provider):
+    """
+    Test that the /api/audio/stream endpoint returns an error if the provider fails before any audio.
+
+    Args:
+        client: Test client
+        fake_voice_provider: Fake voice provider
+    """
+    fake_voice_provider.fail = True
+
+    response = client.post("/api/audio/stream", json={"text": "hello"})
+
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert "provider unavailable" in response.json()["detail"]
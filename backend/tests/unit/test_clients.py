@@ -0,0 +1,33 @@
+"""
+Unit tests for the shared API clients.
+"""
+
+from src.services import clients
+
+
+async def test_http_client_is_shared_until_closed():
+    """
+    Test that get_http_client returns one client until close_clients closes it.
+    """
+    client = clients.get_http_client()
+    assert clients.get_http_client() is client
+
+    await clients.close_clients()
+
+    assert client.is_closed
+    assert clients.get_http_client() is not client
+    await clients.close_clients()
+
+
+async def test_http_client_keeps_idle_connections_for_60s():
+    """
+    Test that the shared client's pool keeps idle connections for 60s, not httpx's default 5s.
+    """
+    pool = clients.get_http_client()._transport._pool
+
+    try:
+        assert pool._keepalive_expiry == 60
+        assert pool._max_keepalive_connections == 50
+        assert pool._max_connections == 100
+    finally:
+        await clients.close_clients()
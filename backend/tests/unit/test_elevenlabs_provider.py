@@ -0,0 +1,162 @@
+"""
+Unit tests for the ElevenLabs stream-input speech generation.
+"""
+
+import asyncio
+import base64
+import json
+
+import pytest
+import websockets
+
+from src.core.config import get_settings
+from src.services.voice_providers.elevenlabs_provider import ElevenLabsProvider
+
+
+class FakeWebSocket:
+    """Stream-input WebSocket that replies to the flush message with canned frames."""
+
+    def __init__(self, frames: list[dict]):
+        self.frames = frames
+        self.sent = []
+        self.closed = False
+        self._incoming = asyncio.Queue()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def send(self, message: str) -> None:
+        data = json.loads(message)
+        self.sent.append(data)
+        if data == {"text": ""}:
+            for frame in self.frames:
+                self._incoming.put_nowait(json.dumps(frame))
+
+    async def close(self) -> None:
+        self.closed = True
+        self._incoming.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        message = await self._incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+def audio_frame(audio: bytes) -> dict:
+    """
+    Build a stream-input frame carrying audio.
+
+    Args:
+        audio: Audio bytes
+
+    Returns:
+        dict: Frame with the base64-encoded audio
+    """
+    return {"audio": base64.b64encode(audio).decode()}
+
+
+async def text_stream(*fragments: str):
+    """
+    Yield text fragments, as a translation stream would.
+
+    Args:
+        fragments: Text fragments, in order
+    """
+    for fragment in fragments:
+        yield fragment
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """
+    Create an ElevenLabs provider with a test API key.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+
+    Returns:
+        ElevenLabsProvider: Provider instance
+    """
+    monkeypatch.setattr(get_settings(), "ELEVENLABS_API_KEY", "test-key")
+    return ElevenLabsProvider()
+
+
+def connect_to(monkeypatch, websocket: FakeWebSocket) -> list[str]:
+    """
+    Make websockets.connect return a fake socket.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+        websocket: Socket to return
+
+    Returns:
+        list[str]: URIs connected to
+    """
+    uris = []
+
+    def connect(uri):
+        uris.append(uri)
+        return websocket
+
+    monkeypatch.setattr(websockets, "connect", connect)
+    return uris
+
+
+async def test_stream_input_sends_text_and_yields_audio(monkeypatch, provider):
+    """
+    Test that text is forwarded after the auth frame and audio is yielded until isFinal.
+    """
+    websocket = FakeWebSocket([audio_frame(b"one"), audio_frame(b"two"), {"isFinal": True}, audio_frame(b"late")])
+    uris = connect_to(monkeypatch, websocket)
+
+    chunks = [
+        chunk
+        async for chunk in provider.generate_speech_from_stream(text_stream("Hello ", "", "world."), voice_id="voice")
+    ]
+
+    assert chunks == [b"one", b"two"]
+    assert uris[0].startswith("wss://api.elevenlabs.io/v1/text-to-speech/voice/stream-input?")
+    assert websocket.sent == [
+        {"text": " ", "xi_api_key": "test-key"},
+        {"text": "Hello "},
+        {"text": "world."},
+        {"text": ""},
+    ]
+    assert websocket.closed
+
+
+async def test_stream_input_raises_on_error_frame(monkeypatch, provider):
+    """
+    Test that an error frame from the server is raised instead of ending the stream silently.
+    """
+    connect_to(monkeypatch, FakeWebSocket([{"error": "invalid_api_key", "message": "Bad key"}]))
+
+    with pytest.raises(RuntimeError, match="invalid_api_key"):
+        async for _ in provider.generate_speech_from_stream(text_stream("Hello")):
+            pass
+
+
+async def test_stream_input_surfaces_sender_failure(monkeypatch, provider):
+    """
+    Test that a failing text stream closes the socket and reaches the caller.
+    """
+    websocket = FakeWebSocket([audio_frame(b"one")])
+    connect_to(monkeypatch, websocket)
+
+    async def failing_text_stream():
+        yield "Hello"
+        raise RuntimeError("translation failed")
+
+    with pytest.raises(RuntimeError, match="translation failed"):
+        async for _ in provider.generate_speech_from_stream(failing_text_stream()):
+            pass
+
+    assert websocket.closed
+    assert {"text": ""} not in websocket.sent
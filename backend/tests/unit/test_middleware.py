@@ -0,0 +1,128 @@
+"""
+Unit tests for the API middleware.
+"""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.api.middleware import JSONGZipMiddleware
+
+LARGE_PAYLOAD = {"text": "x" * 2048}
+SMALL_PAYLOAD = {"text": "x"}
+
+
+@pytest.fixture(scope="module")
+def audio_file(tmp_path_factory):
+    """
+    Create an audio file to serve.
+
+    Args:
+        tmp_path_factory: Pytest temporary path factory
+
+    Returns:
+        Path: Path to the file
+    """
+    path = tmp_path_factory.mktemp("audio") / "audio.mp3"
+    path.write_bytes(b"\xff\xfb" * 2048)
+    return path
+
+
+@pytest.fixture(scope="module")
+def gzip_client(audio_file):
+    """
+    Create a test client for a minimal application wrapped in JSONGZipMiddleware.
+
+    Args:
+        audio_file: Audio file served by the /file route
+
+    Returns:
+        TestClient: Test client
+    """
+    app = FastAPI()
+    app.add_middleware(JSONGZipMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    async def large():
+        return JSONResponse(LARGE_PAYLOAD)
+
+    @app.get("/small")
+    async def small():
+        return JSONResponse(SMALL_PAYLOAD)
+
+    @app.get("/file")
+    async def file():
+        return FileResponse(audio_file, media_type="audio/mpeg")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            yield b"a" * 2048
+            yield b"b" * 2048
+
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    return TestClient(app)
+
+
+def get_raw(client: TestClient, path: str, accept_encoding: str):
+    """
+    Make a request and return the response with its body still encoded.
+
+    Args:
+        client: Test client
+        path: Request path
+        accept_encoding: Accept-Encoding header to send
+
+    Returns:
+        tuple: (response, raw body bytes)
+    """
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_large_json_is_gzipped(gzip_client):
+    """Large JSON bodies are compressed, with Content-Length and Vary rewritten."""
+    response, body = get_raw(gzip_client, "/large", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-length"] == str(len(body))
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert gzip.decompress(body) == JSONResponse(LARGE_PAYLOAD).body
+
+
+def test_json_not_gzipped_without_accept_encoding(gzip_client):
+    """Clients that don't accept gzip get the plain body."""
+    response, body = get_raw(gzip_client, "/large", "identity")
+
+    assert "content-encoding" not in response.headers
+    assert body == JSONResponse(LARGE_PAYLOAD).body
+
+
+def test_small_json_not_gzipped(gzip_client):
+    """JSON bodies below the minimum size are sent as is."""
+    response, body = get_raw(gzip_client, "/small", "gzip")
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(body))
+    assert body == JSONResponse(SMALL_PAYLOAD).body
+
+
+def test_file_response_passes_through(gzip_client, audio_file):
+    """FileResponse bodies are not compressed, keeping their Content-Length."""
+    response, body = get_raw(gzip_client, "/file", "gzip")
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(audio_file.stat().st_size)
+    assert body == audio_file.read_bytes()
+
+
+def test_streaming_response_passes_through(gzip_client):
+    """Streamed bodies are not compressed, even when their content type is JSON."""
+    response, body = get_raw(gzip_client, "/stream", "gzip")
+
+    assert "content-encoding" not in response.headers
+    assert body == b"a" * 2048 + b"b" * 2048
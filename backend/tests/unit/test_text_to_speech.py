@@ -0,0 +1,102 @@
+"""
+Unit tests for the streaming text-to-speech service.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services import text_to_speech
+
+TEXT = "One. Two. Three. Four. Five."
+TEXT_CHUNKS = ["One.", "Two.", "Three.", "Four.", "Five."]
+
+
+class FakeVoiceProvider:
+    """Voice provider that streams numbered audio chunks, tracking how many streams are open."""
+
+    def __init__(self, fail_on: str = None):
+        self.fail_on = fail_on
+        self.active = 0
+        self.max_active = 0
+
+    async def generate_speech_stream(self, text: str, voice_id: str = None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            for i in range(3):
+                await asyncio.sleep(0.001)
+                if text == self.fail_on:
+                    raise RuntimeError("provider unavailable")
+                yield f"{text}{i}".encode()
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """
+    Install a fake provider as the voice provider.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+
+    Returns:
+        FakeVoiceProvider: The installed provider
+    """
+    provider = FakeVoiceProvider()
+    monkeypatch.setattr(text_to_speech, "create_voice_provider", lambda provider_name: provider)
+    return provider
+
+
+async def settle():
+    """Let cancelled stream tasks run their cleanup."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def test_generate_speech_stream_yields_chunks_in_order(provider):
+    """
+    Test that audio from concurrently synthesized text chunks is yielded in text order.
+    """
+    chunks = [chunk async for chunk in text_to_speech.generate_speech_stream(TEXT, max_chars=5)]
+
+    assert chunks == [f"{text}{i}".encode() for text in TEXT_CHUNKS for i in range(3)]
+
+
+async def test_generate_speech_stream_limits_concurrency(provider):
+    """
+    Test that at most MAX_CONCURRENT_STREAMS provider streams are open at once.
+    """
+    async for _ in text_to_speech.generate_speech_stream(TEXT, max_chars=5):
+        pass
+
+    assert provider.max_active == text_to_speech.MAX_CONCURRENT_STREAMS
+    assert provider.active == 0
+
+
+async def test_generate_speech_stream_raises_and_closes_streams_on_failure(provider):
+    """
+    Test that a failed chunk stream reaches the caller and the other streams are closed.
+    """
+    provider.fail_on = "Two."
+
+    with pytest.raises(RuntimeError, match="provider unavailable"):
+        async for _ in text_to_speech.generate_speech_stream(TEXT, max_chars=5):
+            pass
+    await settle()
+
+    assert provider.active == 0
+
+
+async def test_generate_speech_stream_closes_streams_on_aclose(provider):
+    """
+    Test that closing the stream early closes the provider streams still running.
+    """
+    stream = text_to_speech.generate_speech_stream(TEXT, max_chars=5)
+
+    assert await anext(stream) == b"One.0"
+    await stream.aclose()
+    await settle()
+
+    assert provider.active == 0
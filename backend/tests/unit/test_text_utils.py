@@ -0,0 +1,68 @@
+"""
+Unit tests for the text utilities.
+"""
+
+import pytest
+
+from src.utils.text_utils import split_text, split_text_with_separators
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "First sentence. Second one! Third?  Fourth after two spaces.",
+        "Line one.\nLine two.\n\nA new paragraph.",
+        "第一句话。第二句话！第三句话？第四句话。",
+        "中文句子。 With a space after. 然后是中文！\nAnd a newline.",
+    ],
+)
+def test_split_text_with_separators_round_trips(text):
+    """
+    Test that joining each chunk with its separator gives back the original text.
+    """
+    chunks = split_text_with_separators(text, max_chars=12)
+
+    assert len(chunks) > 1
+    assert "".join(chunk + separator for chunk, separator in chunks) == text
+    assert chunks[-1][1] == ""
+    for chunk, separator in chunks:
+        assert chunk == chunk.strip()
+        assert separator.strip() == ""
+
+
+def test_split_text_with_separators_keeps_cjk_sentences_unseparated():
+    """
+    Test that chunks split after CJK punctuation get an empty separator, not a space.
+    """
+    chunks = split_text_with_separators("第一句话。第二句话。", max_chars=6)
+
+    assert chunks == [("第一句话。", ""), ("第二句话。", "")]
+
+
+def test_split_text_packs_sentences_in_order():
+    """
+    Test that sentences are packed greedily into chunks of at most max_chars, in order.
+    """
+    text = "One. Two. Three. Four. Five."
+
+    assert split_text(text, max_chars=11) == ["One. Two.", "Three.", "Four. Five."]
+
+
+def test_split_text_keeps_long_sentence_whole():
+    """
+    Test that a sentence longer than max_chars becomes a chunk of its own.
+    """
+    text = "Short. This sentence is much longer than the limit. End."
+
+    assert split_text(text, max_chars=10) == [
+        "Short.",
+        "This sentence is much longer than the limit.",
+        "End.",
+    ]
+
+
+def test_split_text_returns_short_text_as_one_chunk():
+    """
+    Test that text within max_chars is returned as a single stripped chunk.
+    """
+    assert split_text_with_separators("  Hello there. Bye.  ", max_chars=100) == [("Hello there. Bye.", "")]
@@ -0,0 +1,89 @@
+"""
+Unit tests for the chunked translation service.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services import translation
+
+
+class FakeTranslationProvider:
+    """Translation provider that upper-cases text, tracking how many requests run at once."""
+
+    def __init__(self, fail_on: str = None):
+        self.fail_on = fail_on
+        self.active = 0
+        self.max_active = 0
+        self.cancelled = 0
+
+    async def translate_text(self, text: str, target_language: str, guideline: str = "") -> str:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.fail_on and self.fail_on in text:
+                raise RuntimeError("provider unavailable")
+            # Finish later chunks first, so the result is only in order if the service reorders it
+            await asyncio.sleep(0.01 if self.fail_on else 0.001 * (100 - len(text)))
+            return text.upper()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+
+    def get_provider_name(self) -> str:
+        return "fake"
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """
+    Install a fake provider as the translation provider.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+
+    Returns:
+        FakeTranslationProvider: The installed provider
+    """
+    provider = FakeTranslationProvider()
+    monkeypatch.setattr(translation, "get_translation_provider", lambda: provider)
+    return provider
+
+
+async def test_translate_text_chunked_preserves_order_and_separators(provider):
+    """
+    Test that translated chunks are rejoined in order with their original separators.
+    """
+    text = "One. Two two.\nThree three three! 第四句。第五句。 Six?"
+
+    result = await translation.translate_text_chunked(text, "English", max_chars=12)
+
+    assert result == text.upper()
+
+
+async def test_translate_text_chunked_limits_concurrency(provider):
+    """
+    Test that at most MAX_CONCURRENT_CHUNKS chunks are translated at once.
+    """
+    text = " ".join(f"Sentence {i}." for i in range(12))
+
+    await translation.translate_text_chunked(text, "English", max_chars=12)
+
+    assert provider.max_active == translation.MAX_CONCURRENT_CHUNKS
+
+
+async def test_translate_text_chunked_falls_back_to_original_text(provider):
+    """
+    Test that a failed chunk returns the original text and cancels the other chunks' requests.
+    """
+    provider.fail_on = "Two"
+    text = "One. Two. Three."
+
+    result = await translation.translate_text_chunked(text, "English", max_chars=5)
+
+    assert result == text
+    assert provider.cancelled == 2
+    assert provider.active == 0